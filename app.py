@@ -1,12 +1,12 @@
 import logging
 import signal
 import sys
-from telegram import Update, ReplyKeyboardMarkup, ReplyKeyboardRemove, BotCommand, BotCommandScopeDefault, InlineKeyboardButton, InlineKeyboardMarkup
+from telegram import Update, ReplyKeyboardMarkup, BotCommand, BotCommandScopeDefault, InlineKeyboardButton, InlineKeyboardMarkup
+from telegram.constants import ParseMode
 from telegram.ext import (
     Application, CommandHandler, MessageHandler,
     filters, ContextTypes, ConversationHandler
 )
-import pytz
 from supabase import create_client
 import socket
 import time
@@ -41,8 +41,8 @@ from handlers.report_handlers import (
     collect_people_count, collect_injuries, collect_building_condition,
     collect_relationship, collect_current_location,
     collect_help_type, collect_resources, collect_availability,
-    collect_custom_coordinates
-
+    collect_custom_coordinates,
+    MAIN_MENU_MARKUP, REMOVE_KEYBOARD
 )
 # Import contact handler
 from handlers.contact_handler import contact_handler
@@ -54,6 +54,18 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Region keyboard shown after a report type is picked from the main menu
+REGION_MARKUP = ReplyKeyboardMarkup([
+    ['ရန်ကုန်', 'မန္တလေး'],
+    ['နေပြည်တော်', 'ပဲခူး'],
+    ['စစ်ကိုင်း', 'မကွေး'],
+    ['ဧရာဝတီ', 'တနင်္သာရီ'],
+    ['မွန်', 'ရှမ်း'],
+    ['ကချင်', 'ကယား/ကရင်နီ'],
+    ['ကရင်', 'ချင်း'],
+    ['ရခိုင်', 'အခြား']
+], resize_keyboard=True)
+
 # Initialize Supabase client with improved error handling
 def initialize_supabase_with_retry(max_retries=3, retry_delay=5):
     """Initialize Supabase client with retry logic"""
@@ -178,22 +190,9 @@ async def start(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
 
 async def show_main_menu(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Show the main menu keyboard."""
-    keyboard = [
-        ['လူပျောက်တိုင်မယ်', 'သတင်းပို့မယ်'],
-        ['အကူအညီတောင်းမယ်', 'အကူအညီပေးမယ်'],
-        ['ID နဲ့ လူရှာမယ်', 'သတင်းပို့သူ ကို ဆက်သွယ်ရန်'],
-        ['နာမည်နဲ့ လူပျောက်ရှာမယ်', 'အစီရင်ခံစာအခြေအနေပြင်ဆင်မယ်']
-    ]
-    
-    reply_markup = ReplyKeyboardMarkup(
-        keyboard, 
-        one_time_keyboard=False,
-        resize_keyboard=True
-    )
-
     await update.message.reply_text(
         "ဆက်လက်၍ မည်သည့်လုပ်ဆောင်ချက်ကို လုပ်ဆောင်လိုပါသလဲ?",
-        reply_markup=reply_markup
+        reply_markup=MAIN_MENU_MARKUP
     )
 
 # Add a new function to handle the initial search request
@@ -204,21 +203,21 @@ async def choose_action(update: Update, context: ContextTypes.DEFAULT_TYPE) -> i
     if text == 'ID နဲ့ လူရှာမယ်':
         await update.message.reply_text(
             "ရှာဖွေလိုသည့် အစီရင်ခံစာ ID ကို ရိုက်ထည့်ပါ:",
-            reply_markup=ReplyKeyboardRemove()
+            reply_markup=REMOVE_KEYBOARD
         )
         return SEARCHING_REPORT
     
     elif text == 'သတင်းပို့သူ ကို ဆက်သွယ်ရန်':
         await update.message.reply_text(
             "ဆက်သွယ်လိုသည့် အစီရင်ခံစာ၏ ID ကို ရိုက်ထည့်ပါ:",
-            reply_markup=ReplyKeyboardRemove()
+            reply_markup=REMOVE_KEYBOARD
         )
         return SEND_MESSAGE
     
     elif text == 'နာမည်နဲ့ လူပျောက်ရှာမယ်':
         await update.message.reply_text(
             "ပျောက်ဆုံးနေသူများကို ရှာရန် အမည် သို့မဟုတ် အသေးစိတ်အချက်အလက်များ ရိုက်ထည့်ပါ:",
-            reply_markup=ReplyKeyboardRemove()
+            reply_markup=REMOVE_KEYBOARD
         )
         return SEARCH_MISSING_PERSON
     
@@ -227,16 +226,7 @@ async def choose_action(update: Update, context: ContextTypes.DEFAULT_TYPE) -> i
         context.user_data['report_type'] = 'Missing Person (Earthquake)'
         await update.message.reply_text(
             "သင်နေထိုင်သည့် မြို့ သို့မဟုတ် ဒေသကို ရွေးချယ်ပါ:",
-            reply_markup=ReplyKeyboardMarkup([
-                ['ရန်ကုန်', 'မန္တလေး'],
-                ['နေပြည်တော်', 'ပဲခူး'],
-                ['စစ်ကိုင်း', 'မကွေး'],
-                ['ဧရာဝတီ', 'တနင်္သာရီ'],
-                ['မွန်', 'ရှမ်း'],
-                ['ကချင်', 'ကယား/ကရင်နီ'],
-                ['ကရင်', 'ချင်း'],
-                ['ရခိုင်', 'အခြား']
-            ], resize_keyboard=True)
+            reply_markup=REGION_MARKUP
         )
         return CHOOSING_LOCATION
     
@@ -244,16 +234,7 @@ async def choose_action(update: Update, context: ContextTypes.DEFAULT_TYPE) -> i
         context.user_data['report_type'] = 'Found Person (Earthquake)'
         await update.message.reply_text(
             "သင်နေထိုင်သည့် မြို့ သို့မဟုတ် ဒေသကို ရွေးချယ်ပါ:",
-            reply_markup=ReplyKeyboardMarkup([
-                ['ရန်ကုန်', 'မန္တလေး'],
-                ['နေပြည်တော်', 'ပဲခူး'],
-                ['စစ်ကိုင်း', 'မကွေး'],
-                ['ဧရာဝတီ', 'တနင်္သာရီ'],
-                ['မွန်', 'ရှမ်း'],
-                ['ကချင်', 'ကယား/ကရင်နီ'],
-                ['ကရင်', 'ချင်း'],
-                ['ရခိုင်', 'အခြား']
-            ], resize_keyboard=True)
+            reply_markup=REGION_MARKUP
         )
         return CHOOSING_LOCATION
         
@@ -261,16 +242,7 @@ async def choose_action(update: Update, context: ContextTypes.DEFAULT_TYPE) -> i
         context.user_data['report_type'] = 'Request Rescue'
         await update.message.reply_text(
             "သင်နေထိုင်သည့် မြို့ သို့မဟုတ် ဒေသကို ရွေးချယ်ပါ:",
-            reply_markup=ReplyKeyboardMarkup([
-                ['ရန်ကုန်', 'မန္တလေး'],
-                ['နေပြည်တော်', 'ပဲခူး'],
-                ['စစ်ကိုင်း', 'မကွေး'],
-                ['ဧရာဝတီ', 'တနင်္သာရီ'],
-                ['မွန်', 'ရှမ်း'],
-                ['ကချင်', 'ကယား/ကရင်နီ'],
-                ['ကရင်', 'ချင်း'],
-                ['ရခိုင်', 'အခြား']
-            ], resize_keyboard=True)
+            reply_markup=REGION_MARKUP
         )
         return CHOOSING_LOCATION
         
@@ -278,16 +250,7 @@ async def choose_action(update: Update, context: ContextTypes.DEFAULT_TYPE) -> i
         context.user_data['report_type'] = 'Offer Help'
         await update.message.reply_text(
             "သင်နေထိုင်သည့် မြို့ သို့မဟုတ် ဒေသကို ရွေးချယ်ပါ:",
-            reply_markup=ReplyKeyboardMarkup([
-                ['ရန်ကုန်', 'မန္တလေး'],
-                ['နေပြည်တော်', 'ပဲခူး'],
-                ['စစ်ကိုင်း', 'မကွေး'],
-                ['ဧရာဝတီ', 'တနင်္သာရီ'],
-                ['မွန်', 'ရှမ်း'],
-                ['ကချင်', 'ကယား/ကရင်နီ'],
-                ['ကရင်', 'ချင်း'],
-                ['ရခိုင်', 'အခြား']
-            ], resize_keyboard=True)
+            reply_markup=REGION_MARKUP
         )
         return CHOOSING_LOCATION
 
@@ -295,7 +258,7 @@ async def choose_action(update: Update, context: ContextTypes.DEFAULT_TYPE) -> i
         await update.message.reply_text(
             "အခြေအနေပြင်ဆင်လိုသည့် အစီရင်ခံစာ ID ကို ရိုက်ထည့်ပါ:\n\n"
             "Please enter the ID of the report you want to update:",
-            reply_markup=ReplyKeyboardRemove()
+            reply_markup=REMOVE_KEYBOARD
         )
         return UPDATE_REPORT_STATUS
     
@@ -304,12 +267,7 @@ async def choose_action(update: Update, context: ContextTypes.DEFAULT_TYPE) -> i
         await update.message.reply_text(
             "❓ I don't understand that command. Please use the keyboard buttons to navigate.\n\n"
             "Command ကို နားမလည်ပါ။ ကျေးဇူးပြု၍ ရွေးချယ်ခွင့်ခလုတ်များကို အသုံးပြုပါ။",
-            reply_markup=ReplyKeyboardMarkup([
-                ['လူပျောက်တိုင်မယ်', 'သတင်းပို့မယ်'],
-                ['အကူအညီတောင်းမယ်', 'အကူအညီပေးမယ်'],
-                ['ID နဲ့ လူရှာမယ်', 'သတင်းပို့သူ ကို ဆက်သွယ်ရန်'],
-                ['နာမည်နဲ့ လူပျောက်ရှာမယ်', 'အစီရင်ခံစာအခြေအနေပြင်ဆင်မယ်']
-            ], resize_keyboard=True)
+            reply_markup=MAIN_MENU_MARKUP
         )
         return CHOOSING_REPORT_TYPE
 
@@ -346,22 +304,9 @@ async def handle_unexpected_input(update: Update, context: ContextTypes.DEFAULT_
 
 async def restore_main_menu(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
     """Restore the main menu after completing an operation."""
-    keyboard = [
-        ['လူပျောက်တိုင်မယ်', 'သတင်းပို့မယ်'],
-        ['အကူအညီတောင်းမယ်', 'အကူအညီပေးမယ်'],
-        ['ID နဲ့ လူရှာမယ်', 'သတင်းပို့သူ ကို ဆက်သွယ်ရန်'],
-        ['နာမည်နဲ့ လူပျောက်ရှာမယ်', 'အစီရင်ခံစာအခြေအနေပြင်ဆင်မယ်']  # Add new option
-    ]
-    
-    reply_markup = ReplyKeyboardMarkup(
-        keyboard, 
-        one_time_keyboard=False,
-        resize_keyboard=True
-    )
-
     await update.message.reply_text(
         "ဆက်လက်၍ မည်သည့်လုပ်ဆောင်ချက်ကို လုပ်ဆောင်လိုပါသလဲ?",
-        reply_markup=reply_markup
+        reply_markup=MAIN_MENU_MARKUP
     )
     
     return CHOOSING_REPORT_TYPE
@@ -391,12 +336,7 @@ async def handle_greeting(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
             "မင်္ဂလာပါ! ပျောက်ဆုံးရှာဖွေရေး ဘော့တ်သို့ ကြိုဆိုပါတယ်။\n\n"
             "Please use the menu below to get started:"
             "စတင်ရန် အောက်ပါမီနူးကို အသုံးပြုပါ။",
-            reply_markup=ReplyKeyboardMarkup([
-                ['လူပျောက်တိုင်မယ်', 'သတင်းပို့မယ်'],
-                ['အကူအညီတောင်းမယ်', 'အကူအညီပေးမယ်'],
-                ['ID နဲ့ လူရှာမယ်', 'သတင်းပို့သူ ကို ဆက်သွယ်ရန်'],
-                ['နာမည်နဲ့ လူပျောက်ရှာမယ်', 'အစီရင်ခံစာအခြေအနေပြင်ဆင်မယ်']
-            ], resize_keyboard=True)
+            reply_markup=MAIN_MENU_MARKUP
         )
         return CHOOSING_REPORT_TYPE
     
@@ -427,7 +367,7 @@ async def help_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
         "• စေတနာ့ဝန်ထမ်း အဖွဲ့များ ဆက်သွယ်ရန် /volunteer ကိုရိုက်ပါ\n"
         "• ရရှိနိုင်သည့် မီနူးအားလုံးစာရင်းကို ကြည့်ရန် /menu ကိုရိုက်ပါ\n\n"
         "ဘေးကင်းလုံခြုံပါစေ၊ ပျက်စီးနေသော အဆောက်အအုံများကို ရှောင်ကြဉ်ပါ!",
-        parse_mode='MARKDOWN'
+        parse_mode=ParseMode.MARKDOWN
     )
 
 
@@ -455,7 +395,7 @@ async def menu_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
         "/cancel - လက်ရှိ လုပ်ဆောင်နေသော လုပ်ငန်းကို ပယ်ဖျက်ရန်\n"
         "/menu - ဤမီနူးကို ပြရန်\n"
         "/getid - သင့် User ID နှင့် အသုံးပြုသူအမည်ကို ရယူပါ",
-        parse_mode='MARKDOWN'
+        parse_mode=ParseMode.MARKDOWN
     )
 
 async def volunteer_info(update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -467,7 +407,7 @@ async def volunteer_info(update: Update, context: ContextTypes.DEFAULT_TYPE):
             f"  Phone: {team['phone']}\n"
             f"  Info: {team['info']}\n"
         )
-    await update.message.reply_text("\n".join(message_lines), parse_mode='MARKDOWN')
+    await update.message.reply_text("\n".join(message_lines), parse_mode=ParseMode.MARKDOWN)
 
 async def get_id(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Get user ID information."""
@@ -479,7 +419,7 @@ async def get_id(update: Update, context: ContextTypes.DEFAULT_TYPE):
         f"Your User ID: `{user.id}`\n"
         f"Your Name: {user.first_name}\n"
         f"Your Username: @{username}",
-        parse_mode='Markdown'  # Use 'Markdown' instead of 'MARKDOWN'
+        parse_mode=ParseMode.MARKDOWN
     )
 
 # Ensure the function is correctly handling the menu option
@@ -9,8 +9,22 @@ BOT_TOKEN = os.getenv("BOT_TOKEN")
 CHANNEL_ID = os.getenv("CHANNEL_ID", "@lost_and_found_news")
 ADMIN_IDS = os.getenv("ADMIN_IDS", "").split(",")
 
-# Store reports in memory (in a production app, this would be a database)
-REPORTS = {}
+# Maximum number of reports kept in the in-memory fallback store
+REPORTS_CACHE_SIZE = int(os.getenv("REPORTS_CACHE_SIZE", "10000"))
+
+# Seconds an in-memory fallback report is kept before it expires (default one week)
+REPORTS_TTL = int(os.getenv("REPORTS_TTL", str(7 * 24 * 3600)))
+
+# Local SQLite file backing the in-memory fallback store
+FALLBACK_DB_PATH = os.getenv("FALLBACK_DB_PATH", "fallback_reports.db")
+
+# Channel posting: attempts per report, and where posts that still fail are kept
+CHANNEL_SEND_ATTEMPTS = int(os.getenv("CHANNEL_SEND_ATTEMPTS", "3"))
+CHANNEL_DEAD_LETTER_FILE = os.getenv("CHANNEL_DEAD_LETTER_FILE", "failed_channel_posts.jsonl")
+
+# Per-user limit on report submissions: at most REPORT_RATE_LIMIT per REPORT_RATE_WINDOW seconds
+REPORT_RATE_LIMIT = int(os.getenv("REPORT_RATE_LIMIT", "10"))
+REPORT_RATE_WINDOW = int(os.getenv("REPORT_RATE_WINDOW", "60"))
 
 # Priority levels
 PRIORITIES = {
@@ -44,4 +58,4 @@ SUPABASE_URL = os.getenv("SUPABASE_URL")
 SUPABASE_KEY = os.getenv("SUPABASE_KEY")
 
 # Export all constants
-__all__ = ['BOT_TOKEN', 'CHANNEL_ID', 'ADMIN_IDS', 'REPORTS', 'PRIORITIES', 'VOLUNTEER_TEAMS', 'SUPABASE_URL', 'SUPABASE_KEY']
+__all__ = ['BOT_TOKEN', 'CHANNEL_ID', 'ADMIN_IDS', 'REPORTS_CACHE_SIZE', 'REPORTS_TTL', 'FALLBACK_DB_PATH', 'REPORT_RATE_LIMIT', 'REPORT_RATE_WINDOW', 'CHANNEL_SEND_ATTEMPTS', 'CHANNEL_DEAD_LETTER_FILE', 'PRIORITIES', 'VOLUNTEER_TEAMS', 'SUPABASE_URL', 'SUPABASE_KEY']
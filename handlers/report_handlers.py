@@ -1,19 +1,31 @@
 from telegram import Update, ReplyKeyboardMarkup, ReplyKeyboardRemove, KeyboardButton
 from telegram.constants import ParseMode
+from telegram.error import BadRequest, NetworkError, RetryAfter, TimedOut
 from telegram.ext import ContextTypes, ConversationHandler
-import uuid
+import secrets
 import logging
 import asyncio
 from datetime import datetime
 import pytz  # Import pytz for timezone handling
-import io, re
+import re
+import functools
+from concurrent.futures import ThreadPoolExecutor
+import html
+import json
+import random
 import boto3
 from botocore.client import Config
 import os
+import sys
+import threading
+import time
+from collections import deque
 
 from utils.message_utils import escape_markdown_v2
-from utils.db_utils import save_report, get_report_by_id, search_reports_by_content, search_missing_people, get_report, update_report_status_in_db
-from config.constants import PRIORITIES, CHANNEL_ID
+from utils.cache_utils import LRUDict
+from utils.fallback_store import persist_report, load_report
+from utils.db_utils import REPORTS, ReportRecord, save_report, search_reports_by_content, search_missing_people, get_report, update_report_status_in_db, update_fallback_status
+from config.constants import PRIORITIES, CHANNEL_ID, REPORT_RATE_LIMIT, REPORT_RATE_WINDOW, CHANNEL_SEND_ATTEMPTS, CHANNEL_DEAD_LETTER_FILE
 from config.states import (
     CHOOSING_REPORT_TYPE, COLLECTING_DATA, PHOTO,
     SEARCHING_REPORT, SEND_MESSAGE, DESCRIPTION,
@@ -29,78 +41,352 @@ from config.states import (
 # Configure logger
 logger = logging.getLogger(__name__)
 
-# In-memory storage for reports if database is not available
-REPORTS = {}
+# Timezones used for report timestamps, resolved once
+MYANMAR_TZ = pytz.timezone('Asia/Yangon')
+UTC = pytz.UTC
+
+# Display format for report timestamps
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Strong references to fire-and-forget tasks so they are not garbage collected mid-run
+_BACKGROUND_TASKS = set()
+
+# Worker threads for blocking boto3 calls, so S3 uploads don't stall the event loop
+_S3_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix='s3')
+
+# Single writer thread for blocking save_report calls: writes stay off the event loop,
+# run one at a time on the shared database connection, and queue up in order under load
+_DB_WRITE_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix='db-write')
+
+# DigitalOcean Spaces bucket and public URL layout for uploaded photos
+DO_SPACES_BUCKET = os.environ.get('DO_SPACES_BUCKET', 'photos')
+DO_SPACES_ENDPOINT = os.environ.get('DO_SPACES_ENDPOINT', '').rstrip('/')
+_PHOTO_URL_TEMPLATE = f"{DO_SPACES_ENDPOINT}/{DO_SPACES_BUCKET}/{{}}"
+
+# Shared S3 client, set by get_s3_client once a connection has succeeded
+_S3_CLIENT = None
+_S3_CLIENT_LOCK = threading.Lock()
+
+# Channel posting settings, resolved once at import
+_CHANNEL_ENABLED = bool(CHANNEL_ID)
+_CHANNEL_SEND_KWARGS = {'chat_id': CHANNEL_ID, 'parse_mode': ParseMode.HTML}
+
+# Telegram photo file_id -> id of the channel message that first posted it
+_CHANNEL_PHOTO_MESSAGES = LRUDict(maxsize=1024)
+
+# Channel posts waiting for the worker; created with the worker on first use so
+# they belong to the running event loop
+_CHANNEL_QUEUE = None
+_CHANNEL_WORKER = None
+_CHANNEL_QUEUE_SIZE = 10000
+_CHANNEL_BATCH_SIZE = 20
+
+# Telegram allows a bot about 20 messages a minute in one channel; the worker
+# keeps within that over a rolling window instead of waiting for flood errors
+_CHANNEL_RATE_LIMIT = 20
+_CHANNEL_RATE_WINDOW = 60.0
+
+# Most channel posts from one batch allowed in flight at once
+_CHANNEL_SEND_LIMIT = asyncio.Semaphore(8)
+
+# Sections of the HTML channel message, in order; format_report_message fills in
+# the escaped fields and leaves out the optional location and photo sections
+_REPORT_HEADER_SECTION = (
+    "{priority_icon} <b>{report_type}</b> {priority_icon}\n"
+    "\n\n"
+    "🆔 <b>REPORT ID / အစီရင်ခံအမှတ်:</b>\n<code>{report_id}</code>\n\n"
+)
+_LOCATION_SECTION = "📍 <b>LOCATION / တည်နေရာ:</b>\n<code>{location}</code>\n\n"
+_DETAILS_SECTION = "ℹ️ <b>DETAILS / အသေးစိတ်:</b>\n<code>{details}</code>\n\n"
+_PHOTO_SECTION = "📷 <b>PHOTO / ဓာတ်ပုံ:</b> <a href='{photo_url}'>View Photo</a>\n\n"
+_REPORT_FOOTER_SECTION = (
+    "{urgency_emoji} <b>URGENCY / အရေးပေါ်အဆင့်:</b>\n<code>{urgency_level}</code>\n\n"
+    "⏰ <b>REPORTED / အချိန်:</b>\n<code>{timestamp} (Asia/Yangon)</code>\n\n"
+    "👤 <b>REPORTED BY / တင်သွင်းသူ:</b>\n<code>{reporter}</code>\n\n"
+)
+# Appended by search_report so the stored channel message shows the current status
+_STATUS_SECTION = "{status_emoji} <b>STATUS / အခြေအနေ:</b>\n<code>{status}</code>\n\n"
+
+# Confirmations sent by finalize_report; only the report ID varies
+REPORT_SUBMITTED_TEMPLATE = (
+    "✅ *YOUR REPORT HAS BEEN SUBMITTED SUCCESSFULLY!*\n\n"
+    "📝 Report ID: `{report_id}`\n\n"
+    "⚠️ *PLEASE SAVE THIS ID FOR FUTURE REFERENCE*\n\n"
+    "သင့်အစီရင်ခံစာကို အောင်မြင်စွာ တင်သွင်းပြီးပါပြီ။\n\n"
+    "အစီရင်ခံစာ ID: `{report_id}`\n\n"
+    "နောင်တွင် အသုံးပြုရန် ဤ ID ကို သိမ်းဆည်းထားပါ။"
+)
+REPORT_STORED_TEMPORARILY_TEMPLATE = (
+    "⚠️ Database connection issue, but your report is stored temporarily.\n\n"
+    "Report ID: `{report_id}`\n\n"
+    "Please save this ID. We'll transfer your report to the database once connection is restored.\n\n"
+    "သင့်အစီရင်ခံစာကို ယာယီသိမ်းဆည်းထားပါသည်။ ဤID ကို သိမ်းဆည်းထားပါ။"
+)
+
+# MarkdownV2 message forwarded to a report's submitter; all fields must be escaped
+SUBMITTER_MESSAGE_TEMPLATE = (
+    "*Message regarding your report ID: {report_id}*\n\n"
+    "{message}\n\n"
+    "From: {name} (@{username})\n"
+    "Contact them directly for more information\\."
+)
+
+# Fields copied from user_data into the saved report, with their defaults
+REPORT_FIELDS = (
+    ('report_id', ''),
+    ('report_type', ''),
+    ('all_data', ''),
+    ('urgency', ''),
+    ('photo_id', None),  # Keep Telegram file_id
+    ('photo_url', None),  # Add DO Spaces URL
+    ('photo_path', None),  # Add DO Spaces path
+    ('location', 'Unknown'),
+)
+
+# Telegram's maximum photo caption length
+CAPTION_LIMIT = 1024
+
+# Length caps applied to user-supplied report fields before saving and posting;
+# keeps the rendered channel message under Telegram's 4096 character limit
+_MAX_LOCATION_LENGTH = 256
+_MAX_DETAILS_LENGTH = 3000
+
+# Search results listed per reply in search_missing_person
+SEARCH_RESULTS_PER_MESSAGE = 10
+
+# Accepted length of a search_missing_person term; longer terms are cut short
+_MIN_SEARCH_TERM_LENGTH = 2
+_MAX_SEARCH_TERM_LENGTH = 64
+
+# Recent report start times per user id, used by allow_report for rate limiting
+_REPORT_TIMESTAMPS = {}
+_last_rate_prune = 0.0
+
+# Shape of a report ID, e.g. MDY-3306AD or 1A2B3C4D, checked after upper-casing
+_REPORT_ID_RE = re.compile(r"[A-Z0-9-]{4,32}")
+
+# First line of a report that carries the name ("1. ...", "Name: ...", "အမည်: ..."),
+# capturing what follows the first ':' (or '.', when there is no ':')
+_NAME_RE = re.compile(r"(?i)(?=1\.|[^\n]*(?:name|အမည်))(?:[^\n:]*:|[^\n.:]*\.)?([^\n]*)")
+
+# Messages that are definitely not reports when sent on their own (see validate_report_data)
+_NON_REPORT_GREETINGS = frozenset({
+    "hello", "hi", "hey", "how are you", "test", "what", "why",
+    "good morning", "good afternoon", "good evening", "help", "ဟယ်လို",
+    "မင်္ဂလာပါ", "နေကောင်းလား", "ဘယ်လိုလဲ", "အကူအညီလိုတယ်", "စမ်းကြည့်တာ"
+})
+# ASCII and Burmese (U+1040-U+1049) digits, spelled out so other scripts don't count
+_DIGIT_RE = re.compile(r"[0-9\u1040-\u1049]")
+
+# Words expected in each report type's details, checked by validate_report_data;
+# each list is compiled into one case-insensitive alternation
+_REPORT_KEYWORDS = (
+    ("Missing Person", ["အမည်", "နာမည်", "အသက်", "ကျား", "မ", "တွေ့", "နေရာ", "ပျောက်",
+                        "name", "age", "male", "female", "location", "last seen", "missing"]),
+    ("Found Person", ["တွေ့", "ရှိ", "အသက်", "ကျား", "မ", "နေရာ", "အခြေအနေ",
+                      "found", "location", "condition", "age", "male", "female"]),
+    ("Request Rescue", ["ကယ်", "အကူအညီ", "တည်နေရာ", "လိပ်စာ", "ဒဏ်ရာ", "ပိတ်မိ", "အရေအတွက်",
+                        "rescue", "help", "location", "address", "injured", "trapped", "count", "people"]),
+    ("Offer Help", ["ကူညီ", "အကူအညီ", "ပေး", "တည်နေရာ", "ရရှိနိုင်",
+                    "help", "offer", "provide", "location", "available"]),
+)
+_REPORT_KEYWORD_PATTERNS = tuple(
+    (type_name, re.compile("|".join(map(re.escape, keywords)), re.IGNORECASE))
+    for type_name, keywords in _REPORT_KEYWORDS
+)
+
+# Main menu keyboard, built once and reused for every menu display
+MAIN_MENU_KEYBOARD = [
+    ['လူပျောက်တိုင်မယ်', 'သတင်းပို့မယ်'],
+    ['အကူအညီတောင်းမယ်', 'အကူအညီပေးမယ်'],
+    ['ID နဲ့ လူရှာမယ်', 'သတင်းပို့သူ ကို ဆက်သွယ်ရန်'],
+    ['နာမည်နဲ့ လူပျောက်ရှာမယ်', 'အစီရင်ခံစာအခြေအနေပြင်ဆင်မယ်']
+]
+MAIN_MENU_MARKUP = ReplyKeyboardMarkup(MAIN_MENU_KEYBOARD, one_time_keyboard=False, resize_keyboard=True)
+
+# Lookup tables and reply keyboards for the report flow, built once at import
+REPORT_TYPE_MAP = {
+    'လူပျောက်တိုင်မယ်': 'Missing Person (Earthquake)',
+    'သတင်းပို့မယ်': 'Found Person (Earthquake)',
+    'အကူအညီတောင်းမယ်': 'Request Rescue',
+    'အကူအညီပေးမယ်': 'Offer Help'
+}
+
+# Location question asked by choose_report_type for each report type
+LOCATION_PROMPTS = {
+    'Missing Person (Earthquake)': (
+        "⚠️ *MISSING PERSON REPORT* ⚠️\n\n"
+        "Please select the location where the person was last seen:\n\n"
+        "ပျောက်ဆုံးနေသူ နောက်ဆုံးတွေ့ရှိခဲ့သည့် တည်နေရာကို ရွေးချယ်ပေးပါ။"
+    ),
+    'Found Person (Earthquake)': (
+        "✅ *FOUND PERSON REPORT* ✅\n\n"
+        "Please select the location where the person was found:\n\n"
+        "လူတွေ့ရှိသည့် တည်နေရာကို ရွေးချယ်ပေးပါ။"
+    ),
+    'Request Rescue': (
+        "⚠️ *RESCUE REQUEST* ⚠️\n\n"
+        "Please select your location to help responders find you quickly:\n\n"
+        "သင့်တည်နေရာကို ရွေးချယ်ပေးပါ။ ကူညီရှာဖွေသူများအတွက် အရေးကြီးပါသည်။"
+    ),
+    'Offer Help': (
+        "🤝 *HELP OFFERING* 🤝\n\n"
+        "Please select your location so those in need can find you:\n\n"
+        "သင့်တည်နေရာကို ရွေးချယ်ပေးပါ။ အကူအညီလိုအပ်သူများအတွက် အရေးကြီးပါသည်။"
+    ),
+}
+_DEFAULT_LOCATION_PROMPT = (
+    "⚙️ *NEW REPORT* ⚙️\n\n"
+    "Please select your location:\n\n"
+    "သင့်တည်နေရာကို ရွေးချယ်ပေးပါ။"
+)
+
+LOCATION_KEYBOARD = [
+    ['ရန်ကုန်', 'မန္တလေး', 'နေပြည်တော်'],
+    ['ပဲခူး', 'စစ်ကိုင်း', 'မကွေး'],
+    ['ဧရာဝတီ', 'တနင်္သာရီ', 'မွန်'],
+    ['ရှမ်း', 'ကချင်', 'ကယား'],
+    ['ကရင်', 'ချင်း', 'ရခိုင်'],
+    ['အခြားတည်နေရာ']
+]
+LOCATION_MARKUP = ReplyKeyboardMarkup(LOCATION_KEYBOARD, one_time_keyboard=True, resize_keyboard=True)
+
+# Regions offered for reports: Burmese button text, English name, and the prefix for case IDs
+REGIONS = (
+    ('ရန်ကုန်', 'Yangon', 'ygn'),
+    ('မန္တလေး', 'Mandalay', 'mdy'),
+    ('နေပြည်တော်', 'Naypyidaw', 'npt'),
+    ('ပဲခူး', 'Bago', 'bgo'),
+    ('စစ်ကိုင်း', 'Sagaing', 'sgg'),
+    ('မကွေး', 'Magway', 'mgw'),
+    ('ဧရာဝတီ', 'Ayeyarwady', 'ayd'),
+    ('တနင်္သာရီ', 'Tanintharyi', 'tnt'),
+    ('မွန်', 'Mon', 'mon'),
+    ('ရှမ်း', 'Shan', 'shn'),
+    ('ကချင်', 'Kachin', 'kch'),
+    ('ကယား/ကရင်နီ', 'Kayah', 'kyh'),
+    ('ကရင်', 'Kayin', 'kyn'),
+    ('ချင်း', 'Chin', 'chn'),
+    ('ရခိုင်', 'Rakhine', 'rkh'),
+    ('အခြား', 'Other Location', 'othr'),
+)
+
+# Location prefix for case IDs, looked up by either the Burmese or the English region name
+LOCATION_PREFIXES = {
+    name: prefix
+    for burmese, english, prefix in REGIONS
+    for name in (burmese, english)
+}
+
+# Upper-case region prefixes that start location-based report IDs
+REPORT_ID_PREFIXES = tuple(prefix.upper() for _, _, prefix in REGIONS)
+
+# First question of each report type's step-by-step form, and the state that collects its answer
+FORM_START_PROMPTS = {
+    'Missing Person (Earthquake)': (
+        "ပျောက်ဆုံးနေသူနှင့် ပတ်သက်သည့် အချက်အလက်များကို တစ်ဆင့်ချင်းစီ မေးပါမည်။\n\n"
+        "ပထမဦးစွာ ပျောက်ဆုံးနေသူ၏ အမည်အပြည့်အစုံကို ရိုက်ထည့်ပါ:",
+        COLLECT_NAME
+    ),
+    'Found Person (Earthquake)': (
+        "တွေ့ရှိထားသူနှင့် ပတ်သက်သည့် အချက်အလက်များကို တစ်ဆင့်ချင်းစီ မေးပါမည်။\n\n"
+        "ပထမဦးစွာ တွေ့ရှိထားသူ၏ အမည်ကို ရိုက်ထည့်ပါ (မသိပါက 'အမည်မသိ' ဟု ရိုက်ထည့်ပါ):",
+        COLLECT_NAME
+    ),
+    'Request Rescue': (
+        "ကယ်ဆယ်ရေးအတွက် လိုအပ်သည့် အချက်အလက်များကို တစ်ဆင့်ချင်းစီ မေးပါမည်။\n\n"
+        "ပထမဦးစွာ ပိတ်မိနေသူ အရေအတွက်ကို ရိုက်ထည့်ပါ (ဥပမာ - ၃ ဦး, 4 people):",
+        COLLECT_PEOPLE_COUNT
+    ),
+    'Offer Help': (
+        "ကူညီပေးနိုင်မည့် အချက်အလက်များကို တစ်ဆင့်ချင်းစီ မေးပါမည်။\n\n"
+        "ပထမဦးစွာ သင့်အမည်ကို ရိုက်ထည့်ပါ:",
+        COLLECT_NAME
+    ),
+}
+
+# Map Burmese urgency levels to English for database storage
+URGENCY_MAP = {
+    "အလွန်အရေးပေါ် (ဆေးကုသမှု လိုအပ်)": "Critical (Medical Emergency)",
+    "အရေးပေါ် (ပိတ်မိနေ/ပျောက်ဆုံး)": "High (Trapped/Missing)",
+    "အလယ်အလတ် (လုံခြုံသော်လည်း ကွဲကွာနေ)": "Medium (Safe but Separated)",
+    "အရေးမကြီး (သတင်းအချက်အလက်သာ)": "Low (Information Only)",
+}
+
+# English urgency levels, still accepted as-is for backward compatibility
+URGENCY_LEVELS = frozenset(URGENCY_MAP.values())
+
+URGENCY_KEYBOARD = [
+    ["အလွန်အရေးပေါ် (ဆေးကုသမှု လိုအပ်)"],
+    ["အရေးပေါ် (ပိတ်မိနေ/ပျောက်ဆုံး)"],
+    ["အလယ်အလတ် (လုံခြုံသော်လည်း ကွဲကွာနေ)"],
+    ["အရေးမကြီး (သတင်းအချက်အလက်သာ)"]
+]
+URGENCY_KEYBOARD_MARKUP = ReplyKeyboardMarkup(URGENCY_KEYBOARD, one_time_keyboard=True, resize_keyboard=True)
+
+# Hides the custom keyboard; shared since it carries no state
+REMOVE_KEYBOARD = ReplyKeyboardRemove()
+
+# Inputs accepted as "skip photo", compared casefolded (the Burmese text has no case)
+SKIP_PHOTO_TOKENS = frozenset({"skip", "skip photo", "ဓာတ်ပုံ မရှိပါ"})
+SKIP_PHOTO_MARKUP = ReplyKeyboardMarkup([["ဓာတ်ပုံ မရှိပါ"]], one_time_keyboard=True, resize_keyboard=True)  # "Skip Photo" in Burmese
+
+STATUS_KEYBOARD = [
+    ["ပျောက်ဆုံးဆဲ (Still Missing)"],
+    ["တွေ့ရှိပြီ (Found)"],
+    ["ဆေးရုံရောက်ရှိနေ (Hospitalized)"],
+    ["ကျဆုံးသွားပြီ (Deceased)"],
+    ["အခြား (Other)"]
+]
+STATUS_MARKUP = ReplyKeyboardMarkup(STATUS_KEYBOARD, one_time_keyboard=True, resize_keyboard=True)
+
+# Status buttons (Burmese and English) -> status value stored in the database
+STATUS_MAP = {
+    "ပျောက်ဆုံးဆဲ (Still Missing)": "Still Missing",
+    "တွေ့ရှိပြီ (Found)": "Found",
+    "ဆေးရုံရောက်ရှိနေ (Hospitalized)": "Hospitalized",
+    "ကျဆုံးသွားပြီ (Deceased)": "Deceased",
+    "အခြား (Other)": "Other"
+}
+
+# Emoji shown next to each stored report status in search results
+STATUS_EMOJI = {
+    "Still Missing": "🔍",
+    "Found": "✅",
+    "Hospitalized": "🏥",
+    "Deceased": "⚫",
+}
+
+# Keywords checked in order for statuses that aren't an exact STATUS_EMOJI key
+_STATUS_EMOJI_KEYWORDS = (
+    ("Missing", "🔍"),
+    ("Found", "✅"),
+    ("Hospitalized", "🏥"),
+    ("Deceased", "⚫"),
+)
+
+GENDER_KEYBOARD = [
+    ['ကျား (Male)', 'မ (Female)'],
+    ['အခြား (Other)', 'မသိပါ (Unknown)']
+]
+GENDER_MARKUP = ReplyKeyboardMarkup(GENDER_KEYBOARD, one_time_keyboard=True, resize_keyboard=True)
 
 async def choose_report_type(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
     """Handle user's selection of report type."""
     text = update.message.text
     
-    report_type_map = {
-        'လူပျောက်တိုင်မယ်': 'Missing Person (Earthquake)',
-        'သတင်းပို့မယ်': 'Found Person (Earthquake)',
-        'အကူအညီတောင်းမယ်': 'Request Rescue',
-        'အကူအညီပေးမယ်': 'Offer Help'
-    }
-    
     # Use the mapped report type if available, otherwise use the original text
-    context.user_data['report_type'] = report_type_map.get(text, text)
+    report_type = context.user_data['report_type'] = REPORT_TYPE_MAP.get(text, text)
     
     # Make sure to set this flag to indicate we're in a conversation
     context.user_data['in_conversation'] = True
     
-    # For all report types, ask for location first
-    keyboard = [
-        ['ရန်ကုန်', 'မန္တလေး', 'နေပြည်တော်'],
-        ['ပဲခူး', 'စစ်ကိုင်း', 'မကွေး'],
-        ['ဧရာဝတီ', 'တနင်္သာရီ', 'မွန်'],
-        ['ရှမ်း', 'ကချင်', 'ကယား'],
-        ['ကရင်', 'ချင်း', 'ရခိုင်'],
-        ['အခြားတည်နေရာ']
-    ]
-    reply_markup = ReplyKeyboardMarkup(keyboard, one_time_keyboard=True, resize_keyboard=True)
-    
-    # Different prompts based on report type
-    if context.user_data['report_type'] == 'Missing Person (Earthquake)':
-        await update.message.reply_text(
-            "⚠️ *MISSING PERSON REPORT* ⚠️\n\n"
-            "Please select the location where the person was last seen:\n\n"
-            "ပျောက်ဆုံးနေသူ နောက်ဆုံးတွေ့ရှိခဲ့သည့် တည်နေရာကို ရွေးချယ်ပေးပါ။",
-            reply_markup=reply_markup,
-            parse_mode='MARKDOWN'
-        )
-    elif context.user_data['report_type'] == 'Found Person (Earthquake)':
-        await update.message.reply_text(
-            "✅ *FOUND PERSON REPORT* ✅\n\n"
-            "Please select the location where the person was found:\n\n"
-            "လူတွေ့ရှိသည့် တည်နေရာကို ရွေးချယ်ပေးပါ။",
-            reply_markup=reply_markup,
-            parse_mode='MARKDOWN'
-        )
-    elif context.user_data['report_type'] == 'Request Rescue':
-        await update.message.reply_text(
-            "⚠️ *RESCUE REQUEST* ⚠️\n\n"
-            "Please select your location to help responders find you quickly:\n\n"
-            "သင့်တည်နေရာကို ရွေးချယ်ပေးပါ။ ကူညီရှာဖွေသူများအတွက် အရေးကြီးပါသည်။",
-            reply_markup=reply_markup,
-            parse_mode='MARKDOWN'
-        )
-    elif context.user_data['report_type'] == 'Offer Help':
-        await update.message.reply_text(
-            "🤝 *HELP OFFERING* 🤝\n\n"
-            "Please select your location so those in need can find you:\n\n"
-            "သင့်တည်နေရာကို ရွေးချယ်ပေးပါ။ အကူအညီလိုအပ်သူများအတွက် အရေးကြီးပါသည်။",
-            reply_markup=reply_markup,
-            parse_mode='MARKDOWN'
-        )
-    else:
-        await update.message.reply_text(
-            "⚙️ *NEW REPORT* ⚙️\n\n"
-            "Please select your location:\n\n"
-            "သင့်တည်နေရာကို ရွေးချယ်ပေးပါ။",
-            reply_markup=reply_markup,
-            parse_mode='MARKDOWN'
-        )
+    # For all report types, ask for location first, with a prompt based on report type
+    await update.message.reply_text(
+        LOCATION_PROMPTS.get(report_type, _DEFAULT_LOCATION_PROMPT),
+        reply_markup=LOCATION_MARKUP,
+        parse_mode=ParseMode.MARKDOWN
+    )
     
     return CHOOSING_LOCATION
 
@@ -115,7 +401,7 @@ async def collect_exact_location_coordinates(update: Update, context: ContextTyp
     context.user_data['form_data']['exact_coordinates'] = f"{latitude},{longitude}"
     
     # Remove keyboard
-    reply_markup = ReplyKeyboardRemove()
+    reply_markup = REMOVE_KEYBOARD
     
     # Acknowledge receipt of location
     await update.message.reply_text(
@@ -164,46 +450,24 @@ async def collect_exact_location_coordinates(update: Update, context: ContextTyp
 
 async def choose_location(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
     """Handle location selection for all report types with step-by-step forms."""
+    # Every report form starts here, so the rate limit is checked before the user fills one in
+    user_id = update.effective_user.id
+    if not allow_report(user_id):
+        logger.warning("Rate limit hit for user %s", user_id)
+        context.user_data.clear()
+        context.user_data['in_conversation'] = True
+        await update.message.reply_text(
+            "⏳ You are submitting reports too quickly. Please wait a minute and try again.\n\n"
+            "အစီရင်ခံစာများ အလွန်မြန်စွာ တင်နေပါသည်။ ခဏစောင့်ပြီး ထပ်စမ်းကြည့်ပါ။",
+            reply_markup=MAIN_MENU_MARKUP
+        )
+        return CHOOSING_REPORT_TYPE
+    
     location = update.message.text
     context.user_data['location'] = location
     
     # Set location prefix for case ID
-    location_prefixes = {
-        'ရန်ကုန်': 'ygn',
-        'မန္တလေး': 'mdy',
-        'နေပြည်တော်': 'npt',
-        'ပဲခူး': 'bgo',
-        'စစ်ကိုင်း': 'sgg',
-        'မကွေး': 'mgw',
-        'ဧရာဝတီ': 'ayd',
-        'တနင်္သာရီ': 'tnt',
-        'မွန်': 'mon',
-        'ရှမ်း': 'shn',
-        'ကချင်': 'kch',
-        'ကယား/ကရင်နီ': 'kyh',
-        'ကရင်': 'kyn',
-        'ချင်း': 'chn',
-        'ရခိုင်': 'rkh',
-        'အခြား': 'othr',
-        'Yangon': 'ygn',
-        'Mandalay': 'mdy',
-        'Naypyidaw': 'npt',
-        'Bago': 'bgo',
-        'Sagaing': 'sgg',
-        'Magway': 'mgw',
-        'Ayeyarwady': 'ayd',
-        'Tanintharyi': 'tnt',
-        'Mon': 'mon',
-        'Shan': 'shn',
-        'Kachin': 'kch',
-        'Kayah': 'kyh',
-        'Kayin': 'kyn',
-        'Chin': 'chn',
-        'Rakhine': 'rkh',
-        'Other Location': 'othr'
-    }
-    
-    prefix = location_prefixes.get(location, 'othr')
+    prefix = LOCATION_PREFIXES.get(location, 'othr')
     context.user_data['case_prefix'] = prefix
     
     # Initialize the form data dictionary
@@ -213,54 +477,27 @@ async def choose_location(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
     report_type = context.user_data.get('report_type', '')
     
     # Start the step-by-step form process based on report type
-    if report_type == 'Missing Person (Earthquake)':
-        await update.message.reply_text(
-            f"ပျောက်ဆုံးနေသူနှင့် ပတ်သက်သည့် အချက်အလက်များကို တစ်ဆင့်ချင်းစီ မေးပါမည်။\n\n"
-            f"ပထမဦးစွာ ပျောက်ဆုံးနေသူ၏ အမည်အပြည့်အစုံကို ရိုက်ထည့်ပါ:"
-        )
-        return COLLECT_NAME
-        
-    elif report_type == 'Found Person (Earthquake)':
-        await update.message.reply_text(
-            f"တွေ့ရှိထားသူနှင့် ပတ်သက်သည့် အချက်အလက်များကို တစ်ဆင့်ချင်းစီ မေးပါမည်။\n\n"
-            f"ပထမဦးစွာ တွေ့ရှိထားသူ၏ အမည်ကို ရိုက်ထည့်ပါ (မသိပါက 'အမည်မသိ' ဟု ရိုက်ထည့်ပါ):"
-        )
-        return COLLECT_NAME
-        
-    elif report_type == 'Request Rescue':
-        await update.message.reply_text(
-            f"ကယ်ဆယ်ရေးအတွက် လိုအပ်သည့် အချက်အလက်များကို တစ်ဆင့်ချင်းစီ မေးပါမည်။\n\n"
-            f"ပထမဦးစွာ ပိတ်မိနေသူ အရေအတွက်ကို ရိုက်ထည့်ပါ (ဥပမာ - ၃ ဦး, 4 people):"
-        )
-        return COLLECT_PEOPLE_COUNT
-    
-    elif report_type == 'Offer Help':
-        await update.message.reply_text(
-            f"ကူညီပေးနိုင်မည့် အချက်အလက်များကို တစ်ဆင့်ချင်းစီ မေးပါမည်။\n\n"
-            f"ပထမဦးစွာ သင့်အမည်ကို ရိုက်ထည့်ပါ:"
-        )
-        return COLLECT_NAME
-    
-    else:
-        # Get instructions based on report type
-        instructions = get_instructions_by_type(report_type)
-        
-        await update.message.reply_text(
-            f"{instructions}"
-        )
-        return COLLECTING_DATA
+    form_start = FORM_START_PROMPTS.get(report_type)
+    if form_start:
+        prompt, next_state = form_start
+        await update.message.reply_text(prompt)
+        return next_state
+    
+    # Other report types send everything at once following the type's instructions
+    await update.message.reply_text(get_instructions_by_type(report_type))
+    return COLLECTING_DATA
 
 
 async def collect_data(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
     """Store all provided data at once and ask for urgency level, with validation."""
     user_input = update.message.text
     
-    # Get expected format for this report type
     report_type = context.user_data.get('report_type', '')
-    expected_format = get_instructions_by_type(report_type)
     
     # Validate input
     if not validate_report_data(user_input, report_type):
+        # Get expected format for this report type, only needed to explain the rejection
+        expected_format = get_instructions_by_type(report_type)
         # If input is too short or looks like a greeting/simple message
         await update.message.reply_text(
             "❌ Your information appears to be incomplete or in the wrong format.\n\n"
@@ -276,26 +513,10 @@ async def collect_data(update: Update, context: ContextTypes.DEFAULT_TYPE) -> in
     context.user_data['all_data'] = user_input
     
     # Generate a unique report ID with location prefix if available
-    prefix = context.user_data.get('case_prefix', '')
-    if prefix:
-        report_id = f"{prefix.upper()}-{str(uuid.uuid4())[:6].upper()}"
-    else:
-        report_id = str(uuid.uuid4())[:8].upper()
-        
-    context.user_data['report_id'] = report_id
+    report_id = context.user_data['report_id'] = generate_report_id(context.user_data.get('case_prefix', ''))
     
     # Create urgency selection keyboard
-    keyboard = [
-        ["အလွန်အရေးပေါ် (ဆေးကုသမှု လိုအပ်)"],
-        ["အရေးပေါ် (ပိတ်မိနေ/ပျောက်ဆုံး)"],
-        ["အလယ်အလတ် (လုံခြုံသော်လည်း ကွဲကွာနေ)"],
-        ["အရေးမကြီး (သတင်းအချက်အလက်သာ)"]
-    ]
-    reply_markup = ReplyKeyboardMarkup(
-        keyboard, 
-        one_time_keyboard=True, 
-        resize_keyboard=True
-    )
+    reply_markup = URGENCY_KEYBOARD_MARKUP
 
     await update.message.reply_text(
         f"အချက်အလက်များ ပေးပို့သည့်အတွက် ကျေးဇူးတင်ပါသည်။ သင့် အစီရင်ခံစာ ID မှာ: *{report_id}*\n\n"
@@ -331,47 +552,31 @@ def validate_report_data(text: str, report_type: str) -> bool:
     if word_count < 4:  # Reduced from 5 to 4 words
         return False
     
-    # Check for common greetings or simple messages that are definitely not reports
-    common_greetings = [
-        "hello", "hi", "hey", "how are you", "test", "what", "why", 
-        "good morning", "good afternoon", "good evening", "help", "ဟယ်လို", 
-        "မင်္ဂလာပါ", "နေကောင်းလား", "ဘယ်လိုလဲ", "အကူအညီလိုတယ်", "စမ်းကြည့်တာ"
-    ]
-    
-    # Only reject if the text is exactly one of these greetings
-    if text.lower().strip() in common_greetings:
-        return False
-    
     # For all report types, simply check if there are multiple lines (as in a form response)
     # or if the text is long enough to be a detailed description
     if text.count('\n') >= 2 or len(text) > 100:
         return True
     
     # Check for numeric content which is likely to be in all valid reports
-    if bool(re.search(r'\d', text)):
+    if _DIGIT_RE.search(text):
         return True
     
+    # Only reject if the text is exactly one of the common greetings; checked after the
+    # structural tests above so typical reports never pay for the lowercased copy
+    if text.lower().strip() in _NON_REPORT_GREETINGS:
+        return False
+    
     # More lenient keyword check - if it contains any potentially relevant words based on type
-    if "Missing Person" in report_type:
-        keywords = ["အမည်", "နာမည်", "အသက်", "ကျား", "မ", "တွေ့", "နေရာ", "ပျောက်", 
-                   "name", "age", "male", "female", "location", "last seen", "missing"]
-    elif "Found Person" in report_type:
-        keywords = ["တွေ့", "ရှိ", "အသက်", "ကျား", "မ", "နေရာ", "အခြေအနေ",
-                   "found", "location", "condition", "age", "male", "female"]
-    elif "Request Rescue" in report_type:
-        keywords = ["ကယ်", "အကူအညီ", "တည်နေရာ", "လိပ်စာ", "ဒဏ်ရာ", "ပိတ်မိ", "အရေအတွက်",
-                   "rescue", "help", "location", "address", "injured", "trapped", "count", "people"]
-    elif "Offer Help" in report_type:
-        keywords = ["ကူညီ", "အကူအညီ", "ပေး", "တည်နေရာ", "ရရှိနိုင်", 
-                   "help", "offer", "provide", "location", "available"]
+    for type_name, pattern in _REPORT_KEYWORD_PATTERNS:
+        if type_name in report_type:
+            break
     else:
         # For other types, be more lenient
         return True
     
     # Check if ANY of the keywords match, not requiring multiple matches
-    for keyword in keywords:
-        if keyword.lower() in text.lower():
-            return True
+    if pattern.search(text):
+        return True
     
     # If we get here, the text doesn't contain any relevant keywords
     # But we'll still return True if it's a medium-length message that might be a valid report
@@ -385,33 +590,15 @@ async def select_urgency(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
     """Handle the selection of urgency level with validation."""
     selected_urgency = update.message.text
     
-    # Map Burmese urgency levels to English for database storage
-    urgency_map = {
-        "အလွန်အရေးပေါ် (ဆေးကုသမှု လိုအပ်)": "Critical (Medical Emergency)",
-        "အရေးပေါ် (ပိတ်မိနေ/ပျောက်ဆုံး)": "High (Trapped/Missing)",
-        "အလယ်အလတ် (လုံခြုံသော်လည်း ကွဲကွာနေ)": "Medium (Safe but Separated)",
-        "အရေးမကြီး (သတင်းအချက်အလက်သာ)": "Low (Information Only)",
-        # Keep English versions for backward compatibility
-        "Critical (Medical Emergency)": "Critical (Medical Emergency)",
-        "High (Trapped/Missing)": "High (Trapped/Missing)",
-        "Medium (Safe but Separated)": "Medium (Safe but Separated)",
-        "Low (Information Only)": "Low (Information Only)"
-    }
-    
+    # Map Burmese labels to English; English labels are stored unchanged
+    urgency = URGENCY_MAP.get(selected_urgency)
+    if urgency is None and selected_urgency in URGENCY_LEVELS:
+        urgency = selected_urgency
+
     # Check if the selection is valid
-    if selected_urgency not in urgency_map:
+    if urgency is None:
         # Show the keyboard again with a message
-        keyboard = [
-            ["အလွန်အရေးပေါ် (ဆေးကုသမှု လိုအပ်)"],
-            ["အရေးပေါ် (ပိတ်မိနေ/ပျောက်ဆုံး)"],
-            ["အလယ်အလတ် (လုံခြုံသော်လည်း ကွဲကွာနေ)"],
-            ["အရေးမကြီး (သတင်းအချက်အလက်သာ)"]
-        ]
-        reply_markup = ReplyKeyboardMarkup(
-            keyboard, 
-            one_time_keyboard=True, 
-            resize_keyboard=True
-        )
+        reply_markup = URGENCY_KEYBOARD_MARKUP
         
         await update.message.reply_text(
             "❌ ကျေးဇူးပြု၍ အောက်ပါ အရေးပေါ်အဆင့်များမှ တစ်ခုကို ရွေးချယ်ပါ:\n\n"
@@ -421,17 +608,10 @@ async def select_urgency(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
         return SELECT_URGENCY
     
     # Store the mapped urgency
-    context.user_data['urgency'] = urgency_map.get(selected_urgency, selected_urgency)
+    context.user_data['urgency'] = urgency
     
     # Create a keyboard with a skip button for photo
-    keyboard = [[
-        "ဓာတ်ပုံ မရှိပါ"  # "Skip Photo" in Burmese
-    ]]
-    reply_markup = ReplyKeyboardMarkup(
-        keyboard, 
-        one_time_keyboard=True, 
-        resize_keyboard=True
-    )
+    reply_markup = SKIP_PHOTO_MARKUP
     
     await update.message.reply_text(
         "အရေးပေါ်အဆင့် သတ်မှတ်ပြီးပါပြီ။\n\n"
@@ -448,110 +628,100 @@ async def finalize_report(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
     """Finalize and save the report to the database"""
     try:
         user_data = context.user_data
+
+        # Normalize the collected fields once here so the save and channel paths can trust them
+        user_data['photo_id'] = user_data.get('photo_id') or None
+        if user_data.get('location'):
+            user_data['location'] = user_data['location'][:_MAX_LOCATION_LENGTH]
+        user_data['all_data'] = (user_data.get('all_data') or '')[:_MAX_DETAILS_LENGTH]
         
         # Prepare report data - Make sure all fields are properly initialized
-        report_data = {
-            'report_id': user_data.get('report_id', ''),
-            'report_type': user_data.get('report_type', ''),
-            'all_data': user_data.get('all_data', ''),
-            'urgency': user_data.get('urgency', ''),
-            'photo_id': user_data.get('photo_id', None),  # Keep Telegram file_id
-            'photo_url': user_data.get('photo_url', None),  # Add DO Spaces URL
-            'photo_path': user_data.get('photo_path', None),  # Add DO Spaces path
-            'location': user_data.get('location', 'Unknown'),
-            'status': 'Still Missing',  # Set a proper default status for new reports
-        }
+        report_data = {key: user_data.get(key, default) for key, default in REPORT_FIELDS}
+        report_data['status'] = 'Still Missing'  # Set a proper default status for new reports
         
         # Get telegram user object
         telegram_user = update.effective_user
         
         # Log the data being saved for debugging
-        logger.info(f"Saving report with ID: {report_data['report_id']}")
-        logger.debug(f"Report data: {report_data}")
+        logger.info("Saving report with ID: %s", report_data['report_id'])
+        logger.debug("Report data: %r", report_data)
         
         try:
-            # Save to database
-            report = save_report(report_data, telegram_user)
+            # Save to database on the writer thread so a slow connection doesn't block the event loop
+            report = await asyncio.get_running_loop().run_in_executor(
+                _DB_WRITE_EXECUTOR, save_report, report_data, telegram_user
+            )
             
             if not report:
                 # If database save fails, store in memory as fallback
-                logger.warning(f"Database save failed, storing report {report_data['report_id']} in memory")
+                logger.warning("Database save failed, storing report %s in memory", report_data['report_id'])
                 # Get current time in Myanmar timezone
-                myanmar_tz = pytz.timezone('Asia/Yangon')
-                timestamp = datetime.now(myanmar_tz).isoformat()
-                store_report(report_data['report_id'], user_data, telegram_user, timestamp)
+                now = datetime.now(MYANMAR_TZ)
                 
-                await update.message.reply_text(
-                    f"⚠️ Database connection issue, but your report is stored temporarily.\n\n"
-                    f"Report ID: `{report_data['report_id']}`\n\n"
-                    f"Please save this ID. We'll transfer your report to the database once connection is restored.\n\n"
-                    f"သင့်အစီရင်ခံစာကို ယာယီသိမ်းဆည်းထားပါသည်။ ဤID ကို သိမ်းဆည်းထားပါ။",
-                    parse_mode='MARKDOWN'
-                )
+                # Format the channel message once and keep it with the in-memory report
+                priority_icon = PRIORITIES.get(user_data['urgency'], "⚪")
+                safe_message = format_report_message(user_data, report_data['report_id'], priority_icon, now.strftime(TIMESTAMP_FORMAT), telegram_user)
+                store_report(report_data['report_id'], user_data, telegram_user, now.isoformat(), safe_message)
                 
+                # Try to send to channel even if database save failed; the post is
+                # queued, before the acknowledgement is awaited, so the two sends overlap
                 try:
-                    # Try to send to channel even if database save failed
-                    priority_icon = PRIORITIES.get(user_data['urgency'], "⚪")
-                    # Format time in Myanmar timezone
-                    timestamp = datetime.now(myanmar_tz).strftime("%Y-%m-%d %H:%M:%S")
-                    safe_message = format_report_message(user_data, report_data['report_id'], priority_icon, timestamp, telegram_user)
-
-                    await send_report_to_channel(context.bot, user_data, safe_message)
+                    # Snapshot user_data: it is cleared below before the queued post is sent
+                    queue_channel_post(context.bot, dict(user_data), safe_message)
                 except Exception as channel_error:
-                    logger.error(f"Error sending report to channel: {str(channel_error)}")
-                    
-                # Show menu after short delay even if DB save failed
-                await asyncio.sleep(2)
-                await show_main_menu(update, context)
+                    logger.error("Error sending report to channel: %s", channel_error)
+                
+                # The confirmation brings back the main menu keyboard itself
+                await update.message.reply_text(
+                    REPORT_STORED_TEMPORARILY_TEMPLATE.format(report_id=report_data['report_id']),
+                    parse_mode=ParseMode.MARKDOWN,
+                    reply_markup=MAIN_MENU_MARKUP
+                )
+                
+                # Clear the report-specific data, keeping the conversation flag set
+                context.user_data.clear()
+                context.user_data['in_conversation'] = True
                     
                 return CHOOSING_REPORT_TYPE
             
             # Include report ID in response with improved formatting
             report_id = report_data['report_id']
-            response = (
-                f"✅ *YOUR REPORT HAS BEEN SUBMITTED SUCCESSFULLY!*\n\n"
-                f"📝 Report ID: `{report_id}`\n\n"
-                f"⚠️ *PLEASE SAVE THIS ID FOR FUTURE REFERENCE*\n\n"
-                f"သင့်အစီရင်ခံစာကို အောင်မြင်စွာ တင်သွင်းပြီးပါပြီ။\n\n"
-                f"အစီရင်ခံစာ ID: `{report_id}`\n\n"
-                f"နောင်တွင် အသုံးပြုရန် ဤ ID ကို သိမ်းဆည်းထားပါ။"
-            )
+            response = REPORT_SUBMITTED_TEMPLATE.format(report_id=report_id)
             
-            await update.message.reply_text(response, parse_mode='MARKDOWN')
+            # Send to channel with improved formatting; the message is only built
+            # when a channel is configured, since nothing else uses it here. It is
+            # queued before the confirmation is awaited so the two sends overlap
+            if _CHANNEL_ENABLED:
+                try:
+                    priority_icon = PRIORITIES.get(user_data['urgency'], "⚪")
+                    # Get current time in Myanmar timezone
+                    timestamp = datetime.now(MYANMAR_TZ).strftime(TIMESTAMP_FORMAT)
+                    safe_message = format_report_message(user_data, report_id, priority_icon, timestamp, telegram_user)
+                    # Snapshot user_data: it is cleared below before the queued post is sent
+                    queue_channel_post(context.bot, dict(user_data), safe_message)
+                except Exception as channel_error:
+                    logger.error("Error sending report to channel: %s", channel_error)
+            else:
+                logger.warning("No channel ID configured. Report not sent to channel.")
             
-            # Send to channel with improved formatting
-            try:
-                priority_icon = PRIORITIES.get(user_data['urgency'], "⚪")
-                # Get current time in Myanmar timezone
-                myanmar_tz = pytz.timezone('Asia/Yangon')
-                timestamp = datetime.now(myanmar_tz).strftime("%Y-%m-%d %H:%M:%S")
-                safe_message = format_report_message(user_data, report_id, priority_icon, timestamp, telegram_user)
-                await send_report_to_channel(context.bot, user_data, safe_message)
-            except Exception as channel_error:
-                logger.error(f"Error sending report to channel: {str(channel_error)}")
+            # The confirmation brings back the main menu keyboard itself, so no
+            # separate menu message has to follow it
+            await update.message.reply_text(response, parse_mode=ParseMode.MARKDOWN, reply_markup=MAIN_MENU_MARKUP)
             
-            # Clear only the report-specific data, but keep the conversation flag
-            for key in list(context.user_data.keys()):
-                if key != 'in_conversation':
-                    context.user_data.pop(key, None)
-        
-            # Set the conversation flag again to be sure
+            # Clear the report-specific data, keeping the conversation flag set
+            context.user_data.clear()
             context.user_data['in_conversation'] = True
             
-            # Show main menu after a short delay to allow user to read the confirmation
-            await asyncio.sleep(2)
-            await show_main_menu(update, context)
-            
             return CHOOSING_REPORT_TYPE
         except Exception as e:
-            logger.error(f"Error saving report: {str(e)}", exc_info=True)
+            logger.error("Error saving report: %s", e, exc_info=True)
             await update.message.reply_text(
                 "❌ Error saving your report. Please try again later.\n\n"
                 "သင့်အစီရင်ခံစာကို မသိမ်းဆည်းနိုင်ပါ။ နောက်မှ ထပ်စမ်းကြည့်ပါ။"
             )
             return ConversationHandler.END
     except Exception as e:
-        logger.error(f"Unexpected error in finalize_report: {str(e)}", exc_info=True)
+        logger.error("Unexpected error in finalize_report: %s", e, exc_info=True)
         await update.message.reply_text(
             "❌ An unexpected error occurred. Please try again later.\n\n"
             "မမျှော်လင့်ထားသော အမှားတစ်ခု ဖြစ်ပေါ်ခဲ့သည်။ နောက်မှ ထပ်စမ်းကြည့်ပါ။"
@@ -563,31 +733,28 @@ async def photo(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
     try:
         # Check if we received a photo
         if update.message.photo:
-            # Acknowledge receipt first to improve user experience
-            await update.message.reply_text(
+            # Acknowledge receipt without waiting for Telegram, so the download and
+            # upload start straight away. It carries no keyboard: it may arrive after
+            # finalize_report's confirmation, which replaces the skip keyboard with the main menu
+            run_in_background(update.message.reply_text(
                 "✅ Photo received! Processing your photo and report..."
-            )
+            ))
             
             # Get the largest available photo (best quality)
             photo_file = update.message.photo[-1]
             file_id = photo_file.file_id
             
             # Log the original file_id for debugging
-            logger.info(f"Received photo with file_id: {file_id} for report ID: {context.user_data.get('report_id')}")
-            
-            # Download the photo file
-            photo_obj = await context.bot.get_file(file_id)
-            photo_bytes_io = io.BytesIO()
-            await photo_obj.download_to_memory(photo_bytes_io)
-            photo_bytes_io.seek(0)  # Reset pointer to beginning of file
+            logger.info("Received photo with file_id: %s for report ID: %s", file_id, context.user_data.get('report_id'))
             
             # Generate a unique filename
             report_id = context.user_data.get('report_id', '')
-            photo_filename = f"{report_id}_{uuid.uuid4()}.jpg"
+            photo_filename = f"{report_id}_{secrets.token_hex(8)}.jpg"
             
             try:
-                # Get S3 client
-                s3_client = get_s3_client()
+                # Get S3 client (its setup makes blocking network calls, so keep it off the event loop)
+                loop = asyncio.get_running_loop()
+                s3_client = await loop.run_in_executor(_S3_EXECUTOR, get_s3_client)
                 
                 if not s3_client:
                     # Fall back to just using Telegram's file_id if S3 client creation fails
@@ -597,43 +764,46 @@ async def photo(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
                     context.user_data['photo_path'] = None
                 else:
                     # Upload to DO Spaces
-                    bucket_name = os.environ.get('DO_SPACES_BUCKET', 'photos')
-                    photo_bytes_io.seek(0)  # Ensure we're at the beginning of the file
+                    bucket_name = DO_SPACES_BUCKET
                     
                     # Log upload attempt
-                    logger.info(f"Uploading photo {photo_filename} to DO Spaces bucket '{bucket_name}'")
+                    logger.info("Uploading photo %s to DO Spaces bucket '%s'", photo_filename, bucket_name)
                     
                     # Explicit ACL and content type settings
                     try:
-                        s3_client.upload_fileobj(
-                            photo_bytes_io,
-                            bucket_name,
-                            photo_filename,
-                            ExtraArgs={
-                                'ACL': 'public-read',
-                                'ContentType': 'image/jpeg'
-                            }
-                        )
+                        # Download the photo only now that it has somewhere to go; Telegram
+                        # photos are at most a few hundred KB, so one in-memory buffer is fine
+                        photo_obj = await context.bot.get_file(file_id)
+                        photo_bytes = await photo_obj.download_as_bytearray()
+                        
+                        # Single PUT straight from the downloaded buffer, no file-like wrapper or copy
+                        await loop.run_in_executor(_S3_EXECUTOR, functools.partial(
+                            s3_client.put_object,
+                            Bucket=bucket_name,
+                            Key=photo_filename,
+                            Body=photo_bytes,
+                            ACL='public-read',
+                            ContentType='image/jpeg'
+                        ))
                         
                         # Generate the public URL
-                        endpoint_url = os.environ.get('DO_SPACES_ENDPOINT', '').rstrip('/')
-                        photo_url = f"{endpoint_url}/{bucket_name}/{photo_filename}"
+                        photo_url = _PHOTO_URL_TEMPLATE.format(photo_filename)
                         
-                        logger.info(f"Uploaded photo to Digital Ocean, URL: {photo_url}")
+                        logger.info("Uploaded photo to Digital Ocean, URL: %s", photo_url)
                         
                         # Store both the original file_id (for Telegram) and the DO Spaces URL
                         context.user_data['photo_id'] = file_id
                         context.user_data['photo_url'] = photo_url 
                         context.user_data['photo_path'] = f"{bucket_name}/{photo_filename}"
                     except Exception as upload_err:
-                        logger.error(f"S3 upload error: {str(upload_err)}", exc_info=True)
+                        logger.error("S3 upload error: %s", upload_err, exc_info=True)
                         # Fall back to just using Telegram's file_id
                         context.user_data['photo_id'] = file_id
                         context.user_data['photo_url'] = None
                         context.user_data['photo_path'] = None
             
             except Exception as upload_error:
-                logger.error(f"Failed to upload photo to Digital Ocean: {str(upload_error)}", exc_info=True)
+                logger.error("Failed to upload photo to Digital Ocean: %s", upload_error, exc_info=True)
                 # Fall back to just using Telegram's file_id
                 context.user_data['photo_id'] = file_id
                 context.user_data['photo_url'] = None
@@ -643,16 +813,7 @@ async def photo(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
                     "⚠️ Could not upload photo to cloud storage, but will continue with report submission using Telegram's storage."
                 )
             
-            # Remove keyboard
-            reply_markup = ReplyKeyboardRemove()
-            
-            # Acknowledge success and continue
-            await update.message.reply_text(
-                "✅ Photo processed! Finalizing your report...",
-                reply_markup=reply_markup
-            )
-            
-            # Continue to finalization
+            # Continue to finalization; its confirmation tells the user the photo went through
             return await finalize_report(update, context)
         else:
             # If somehow this handler was called but no photo is present
@@ -662,7 +823,7 @@ async def photo(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
             )
             return PHOTO
     except Exception as e:
-        logger.error(f"Error processing photo: {str(e)}", exc_info=True)
+        logger.error("Error processing photo: %s", e, exc_info=True)
         await update.message.reply_text(
             "❌ There was an error processing your photo. Please try again or use 'Skip Photo'."
         )
@@ -690,18 +851,16 @@ async def handle_skip_photo(update: Update, context: ContextTypes.DEFAULT_TYPE)
         # Check if the user clicked the skip button or typed "skip"
         user_input = update.message.text.strip()
         
-        logger.info(f"Photo skip handler received: {user_input}")
+        logger.info("Photo skip handler received: %s", user_input)
         
         # Allow either "skip" (typed) or "Skip Photo" (button press) or Burmese version
-        if (user_input.lower() == "skip" or 
-            user_input == "Skip Photo" or 
-            user_input == "ဓာတ်ပုံ မရှိပါ"):
+        if user_input.casefold() in SKIP_PHOTO_TOKENS:
             
             # Set no photo indicator
             context.user_data['photo_id'] = None
             
             # Remove keyboard
-            reply_markup = ReplyKeyboardRemove()
+            reply_markup = REMOVE_KEYBOARD
             await update.message.reply_text(
                 "ဓာတ်ပုံကို ကျော်သွားပါမည်...",
                 reply_markup=reply_markup
@@ -711,14 +870,7 @@ async def handle_skip_photo(update: Update, context: ContextTypes.DEFAULT_TYPE)
             return await finalize_report(update, context)
         else:
             # User input something else - ask again
-            keyboard = [[
-                "ဓာတ်ပုံ မရှိပါ"  # Skip Photo in Burmese
-            ]]
-            reply_markup = ReplyKeyboardMarkup(
-                keyboard, 
-                one_time_keyboard=True, 
-                resize_keyboard=True
-            )
+            reply_markup = SKIP_PHOTO_MARKUP
             
             await update.message.reply_text(
                 "ဓာတ်ပုံပေးပို့ပါ သို့မဟုတ် 'ဓာတ်ပုံ မရှိပါ' ခလုတ်ကိုနှိပ်ပါ။",
@@ -728,7 +880,7 @@ async def handle_skip_photo(update: Update, context: ContextTypes.DEFAULT_TYPE)
             # Stay in the same state
             return PHOTO
     except Exception as e:
-        logger.error(f"Error in handle_skip_photo: {str(e)}")
+        logger.error("Error in handle_skip_photo: %s", e)
         await update.message.reply_text(
             "❌ အမှားတစ်ခု ဖြစ်ပွားခဲ့သည်။ ထပ်မံကြိုးစားပါ သို့မဟုတ် /cancel သုံးပြီး အစကနေစတင်ပါ။"
         )
@@ -736,20 +888,25 @@ async def handle_skip_photo(update: Update, context: ContextTypes.DEFAULT_TYPE)
 
 async def search_report(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
     """Search for a report by ID with improved formatting"""
-    report_id = update.message.text.strip()
+    report_id = update.message.text.strip().upper()
+    
+    # Anything that can't be a report ID (e.g. menu text) is turned away without a lookup
+    if not _REPORT_ID_RE.fullmatch(report_id):
+        await update.message.reply_text(
+            "❌ Invalid report ID format. Please check and try again.\n\n"
+            "အစီရင်ခံစာ ID ပုံစံ မမှန်ကန်ပါ။ စစ်ဆေးပြီး ထပ်စမ်းကြည့်ပါ။"
+        )
+        await show_main_menu(update, context)
+        return CHOOSING_REPORT_TYPE
     
     try:
-        logger.info(f"Searching for report with ID: {report_id}")
+        logger.info("Searching for report with ID: %s", report_id)
         
-        # Get report from database
-        report = await get_report(report_id)
+        # Get report from the database or the in-memory backup
+        report = await find_report(report_id)
         
         if not report:
-            # Check in-memory backup
-            if report_id in REPORTS:
-                report = REPORTS[report_id]
-            
-            logger.info(f"No report found with ID: {report_id}")
+            logger.info("No report found with ID: %s", report_id)
             await update.message.reply_text(
                 "❌ No report found with that ID. Please check and try again.\n\n"
                 "ထို ID ဖြင့် အစီရင်ခံစာ မတွေ့ရှိပါ။ စစ်ဆေးပြီး ထပ်စမ်းကြည့်ပါ။"
@@ -758,84 +915,68 @@ async def search_report(update: Update, context: ContextTypes.DEFAULT_TYPE) -> i
             await show_main_menu(update, context)
             return CHOOSING_REPORT_TYPE
         
-        # Log the report data structure for debugging
-        logger.info(f"Report found: {type(report)} with keys: {report.keys() if isinstance(report, dict) else 'Not a dict'}")
+        # Remember the submitter so contacting them later needs no extra lookup
+        context.user_data.setdefault('report_user_ids', {})[report_id] = report.get('user_id')
+        
+        # Add status if available
+        status = report.get('status')
+        if not status or status == 'No status set' or status == 'N/A':
+            status = "Still Missing"
+            # Update the in-memory version if this is the source, without holding up the reply
+            if report_id in REPORTS:
+                run_in_background(update_fallback_status(REPORTS[report_id], status), name=f'update_status:{report_id}')
+                
+        status_emoji = get_status_emoji(status)
+        
+        # In-memory reports keep the message formatted at submission time; it predates
+        # any status change, so the current status is added below it
+        safe_message = report.get('safe_message')
+        if safe_message:
+            safe_message += _STATUS_SECTION.format(status_emoji=status_emoji, status=html.escape(status, quote=False))
+            await reply_with_photo(update.message, safe_message, ParseMode.HTML, report.get('photo_id'))
+            await show_main_menu(update, context)
+            return CHOOSING_REPORT_TYPE
+        
+        # Log the report data structure for debugging; the key list is only built when it will be logged
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Report found: %s with keys: %s", type(report).__name__, list(report) if isinstance(report, dict) else 'Not a dict')
         
         # Convert created_at to Myanmar timezone if it exists
         created_at = report.get('created_at', 'N/A')
         if created_at != 'N/A':
             try:
-                if isinstance(created_at, str):
-                    dt = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
-                else:
-                    dt = created_at
-                
-                # If timezone info not present, assume UTC and convert to Myanmar timezone
-                if dt.tzinfo is None:
-                    dt = dt.replace(tzinfo=pytz.UTC)
-                
-                myanmar_tz = pytz.timezone('Asia/Yangon')
-                dt = dt.astimezone(myanmar_tz)
-                created_at = dt.strftime("%Y-%m-%d %H:%M:%S") + " (Asia/Yangon)"
+                created_at = format_myanmar_time(created_at)
             except Exception as e:
-                logger.error(f"Error converting timestamp to Myanmar timezone: {str(e)}")
-        
-        # Format the response with improved readability
-        response = f"📋 *REPORT DETAILS:*\n\n"
-        response += f"📝 *Type:* {report.get('report_type', 'N/A')}\n\n"
-        response += f"📍 *Location:* {report.get('location', 'N/A')}\n\n"
-        response += f"ℹ️ *Details:*\n{report.get('all_data', 'N/A')}\n\n"
+                logger.error("Error converting timestamp to Myanmar timezone: %s", e)
         
         # Add appropriate emoji for urgency level
         urgency = report.get('urgency', 'N/A')
-        urgency_emoji = "🔴" if "Critical" in urgency else "🟠" if "High" in urgency else "🟡" if "Medium" in urgency else "🟢"
-        response += f"{urgency_emoji} *Urgency:* {urgency}\n\n"
-        
-        # Add status if available
-        status = report.get('status')
-        if not status or status == 'No status set' or status == 'N/A':
-            status = "Still Missing"
-            # Update the in-memory version if this is the source
-            if report_id in REPORTS:
-                REPORTS[report_id]['status'] = status
-                
-        status_emoji = "🔍" if "Missing" in status else "✅" if "Found" in status else "🏥" if "Hospitalized" in status else "⚫" if "Deceased" in status else "❓"
-        response += f"{status_emoji} *Status:* {status}\n\n"
+        urgency_emoji = PRIORITIES.get(urgency, "🟢")
         
-        response += f"⏰ *Submitted:* {created_at}\n"
-        
-        await update.message.reply_text(response, parse_mode='MARKDOWN')
+        # Format the response with improved readability
+        response = (
+            f"📋 *REPORT DETAILS:*\n\n"
+            f"📝 *Type:* {report.get('report_type', 'N/A')}\n\n"
+            f"📍 *Location:* {report.get('location', 'N/A')}\n\n"
+            f"ℹ️ *Details:*\n{report.get('all_data', 'N/A')}\n\n"
+            f"{urgency_emoji} *Urgency:* {urgency}\n\n"
+            f"{status_emoji} *Status:* {status}\n\n"
+            f"⏰ *Submitted:* {created_at}\n"
+        )
         
-        # If there's a photo, send it too
-        photo_id = report.get('photo_id')
+        # Add the photo URL to the response, then send it together with the photo if there is one
         photo_url = report.get('photo_url')
-
         if photo_url:
-            # Add the photo URL to the response
-            await update.message.reply_text(f"📷 *Photo:* [View Photo]({photo_url})", parse_mode='MARKDOWN')
-            
-        if photo_id:
-            try:
-                # Try to send the photo directly using Telegram's storage
-                await update.message.reply_photo(photo_id)
-            except Exception as photo_error:
-                logger.error(f"Error sending photo: {str(photo_error)}")
-                if photo_url:
-                    await update.message.reply_text(
-                        f"📷 This report has a photo that can be viewed at: {photo_url}"
-                    )
-                else:
-                    await update.message.reply_text(
-                        "📷 This report has a photo but it could not be displayed."
-                    )
+            response += f"\n📷 *Photo:* [View Photo]({photo_url})"
+        
+        await reply_with_photo(update.message, response, ParseMode.MARKDOWN, report.get('photo_id'))
         
-        # Show main menu after displaying report
-        await asyncio.sleep(2)
+        # Show main menu right after the result
         await show_main_menu(update, context)
         
         return CHOOSING_REPORT_TYPE
     except Exception as e:
-        logger.error(f"Error in search_report: {str(e)}", exc_info=True)
+        logger.error("Error in search_report: %s", e, exc_info=True)
         await update.message.reply_text(
             "❌ An error occurred while retrieving the report information. Please try again later."
         )
@@ -845,7 +986,15 @@ async def search_report(update: Update, context: ContextTypes.DEFAULT_TYPE) -> i
 
 async def search_missing_person(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
     """Search for missing persons based on name or details"""
-    search_term = update.message.text.strip()
+    search_term = update.message.text.strip()[:_MAX_SEARCH_TERM_LENGTH]
+    
+    # A one-letter term matches nearly every report; ask for more before querying
+    if len(search_term) < _MIN_SEARCH_TERM_LENGTH:
+        await update.message.reply_text(
+            "❌ Please enter at least 2 characters to search.\n\n"
+            "ကျေးဇူးပြု၍ အနည်းဆုံး စာလုံး ၂ လုံး ရိုက်ထည့်ပါ။"
+        )
+        return SEARCH_MISSING_PERSON
     
     # Search in database
     results = await search_missing_people(search_term)
@@ -859,29 +1008,28 @@ async def search_missing_person(update: Update, context: ContextTypes.DEFAULT_TY
         await show_main_menu(update, context)
         return CHOOSING_REPORT_TYPE
     
-    # Show results
-    response = f"🔍 *Search Results:*\nFound {len(results)} matching records.\n\n"
-    
-    for i, report in enumerate(results, 1):
-        # Extract name if possible
-        name = "Unknown"
-        all_data = report.get('all_data', '')
-        lines = all_data.split('\n')
-        for line in lines:
-            if line.startswith("1.") or "name" in line.lower() or "အမည်" in line:
-                name = line.split(":", 1)[1].strip() if ":" in line else line.split(".", 1)[1].strip() if "." in line else line
-                break
-        
-        response += f"{i}. *{name}*\n"
-        response += f"   Location: {report.get('location', 'N/A')}\n"
-        response += f"   Report ID: `{report.get('report_id')}`\n\n"
-    
-    response += "To view full details of a report, search by its ID using 'Search Reports by ID'."
-    
-    await update.message.reply_text(response, parse_mode='MARKDOWN')
+    # Remember the submitters so contacting them later needs no extra lookup
+    report_user_ids = context.user_data.setdefault('report_user_ids', {})
+    for report in results:
+        report_user_ids[report.get('report_id', '').upper()] = report.get('user_id')
+    
+    # Show results in messages of SEARCH_RESULTS_PER_MESSAGE, so long result lists
+    # stay under Telegram's message size limit and start arriving sooner
+    entries = [
+        f"{i}. <b>{html.escape(extract_name(report.get('all_data') or ''), quote=False)}</b>\n"
+        f"   Location: {html.escape(str(report.get('location') or 'N/A'), quote=False)}\n"
+        f"   Report ID: <code>{html.escape(str(report.get('report_id')), quote=False)}</code>\n"
+        for i, report in enumerate(results, 1)
+    ]
+    entries[0] = f"🔍 <b>Search Results:</b>\nFound {len(results)} matching records.\n\n" + entries[0]
+    entries[-1] += "\nTo view full details of a report, search by its ID using 'Search Reports by ID'."
+    for start in range(0, len(entries), SEARCH_RESULTS_PER_MESSAGE):
+        await update.message.reply_text(
+            "\n".join(entries[start:start + SEARCH_RESULTS_PER_MESSAGE]),
+            parse_mode=ParseMode.HTML
+        )
     
     # Always return to main menu after showing results
-    await asyncio.sleep(2)
     await show_main_menu(update, context)
     return CHOOSING_REPORT_TYPE
 
@@ -890,31 +1038,27 @@ async def update_report_status(update: Update, context: ContextTypes.DEFAULT_TYP
     report_id = update.message.text.strip().upper()
     
     try:
-        logger.info(f"Looking for report with ID: {report_id} to update status")
+        logger.info("Looking for report with ID: %s to update status", report_id)
         
-        # Get report from database
-        report = await get_report(report_id)
+        # Get report from the database or the in-memory backup
+        report = await find_report(report_id)
         
         if not report:
-            # Check in-memory backup
-            if report_id in REPORTS:
-                report = REPORTS[report_id]
-            else:
-                logger.info(f"No report found with ID: {report_id}")
-                await update.message.reply_text(
-                    "❌ No report found with that ID. Please check and try again.\n\n"
-                    "ထို ID ဖြင့် အစီရင်ခံစာ မတွေ့ရှိပါ။ စစ်ဆေးပြီး ထပ်စမ်းကြည့်ပါ။"
-                )
-                # Return to main menu if no report found
-                await show_main_menu(update, context)
-                return CHOOSING_REPORT_TYPE
+            logger.info("No report found with ID: %s", report_id)
+            await update.message.reply_text(
+                "❌ No report found with that ID. Please check and try again.\n\n"
+                "ထို ID ဖြင့် အစီရင်ခံစာ မတွေ့ရှိပါ။ စစ်ဆေးပြီး ထပ်စမ်းကြည့်ပါ။"
+            )
+            # Return to main menu if no report found
+            await show_main_menu(update, context)
+            return CHOOSING_REPORT_TYPE
         
         # Get the owner's user ID 
         owner_id = report.get('user_id')
         
         # Check if user is the report owner
         if owner_id != update.effective_user.id:
-            logger.warning(f"User {update.effective_user.id} attempted to update report {report_id} owned by user {owner_id}")
+            logger.warning("User %s attempted to update report %s owned by user %s", update.effective_user.id, report_id, owner_id)
             
             # Get your Telegram ID for comparison
             your_id = update.effective_user.id
@@ -938,22 +1082,9 @@ async def update_report_status(update: Update, context: ContextTypes.DEFAULT_TYP
         current_status = report.get('status')
         if not current_status or current_status == 'No status set':
             current_status = "Still Missing"
-            # Update the report object to include this default
-            report['status'] = current_status
         
         # Create keyboard with status options
-        keyboard = [
-            ["ပျောက်ဆုံးဆဲ (Still Missing)"],
-            ["တွေ့ရှိပြီ (Found)"],
-            ["ဆေးရုံရောက်ရှိနေ (Hospitalized)"],
-            ["ကျဆုံးသွားပြီ (Deceased)"],
-            ["အခြား (Other)"]
-        ]
-        reply_markup = ReplyKeyboardMarkup(
-            keyboard, 
-            one_time_keyboard=True, 
-            resize_keyboard=True
-        )
+        reply_markup = STATUS_MARKUP
 
         await update.message.reply_text(
             f"လက်ရှိအခြေအနေ: *{current_status}*\n\n"
@@ -965,7 +1096,7 @@ async def update_report_status(update: Update, context: ContextTypes.DEFAULT_TYP
         return CHOOSE_STATUS
         
     except Exception as e:
-        logger.error(f"Error in update_report_status: {str(e)}", exc_info=True)
+        logger.error("Error in update_report_status: %s", e, exc_info=True)
         await update.message.reply_text(
             "❌ An error occurred while retrieving the report. Please try again later."
         )
@@ -986,17 +1117,8 @@ async def choose_status(update: Update, context: ContextTypes.DEFAULT_TYPE) -> i
         await show_main_menu(update, context)
         return CHOOSING_REPORT_TYPE
     
-    # Map Burmese status to database values
-    status_map = {
-        "ပျောက်ဆုံးဆဲ (Still Missing)": "Still Missing",
-        "တွေ့ရှိပြီ (Found)": "Found",
-        "ဆေးရုံရောက်ရှိနေ (Hospitalized)": "Hospitalized",
-        "ကျဆုံးသွားပြီ (Deceased)": "Deceased",
-        "အခြား (Other)": "Other"
-    }
-    
     # Use English status for database
-    status = status_map.get(status_text, status_text)
+    status = STATUS_MAP.get(status_text, status_text)
     
     try:
         # Update status in database
@@ -1004,7 +1126,7 @@ async def choose_status(update: Update, context: ContextTypes.DEFAULT_TYPE) -> i
         
         if success:
             # Remove keyboard and confirm update
-            reply_markup = ReplyKeyboardRemove()
+            reply_markup = REMOVE_KEYBOARD
             
             await update.message.reply_text(
                 f"✅ Status of report {report_id} has been updated to: *{status}*\n\n"
@@ -1026,7 +1148,7 @@ async def choose_status(update: Update, context: ContextTypes.DEFAULT_TYPE) -> i
             return CHOOSING_REPORT_TYPE
             
     except Exception as e:
-        logger.error(f"Error updating status: {str(e)}", exc_info=True)
+        logger.error("Error updating status: %s", e, exc_info=True)
         await update.message.reply_text(
             "❌ An error occurred while updating the report status. Please try again later."
         )
@@ -1048,21 +1170,25 @@ async def send_message_to_submitter(update: Update, context: ContextTypes.DEFAUL
         return CHOOSING_REPORT_TYPE
     
     try:
-        # Get report from database
-        report = context.user_data.get('contact_report')
-        if not report:
-            report = await get_report(report_id)
-        
-        if not report:
-            await update.message.reply_text(
-                "❌ Error: Report not found. Please try again."
-            )
-            # Return to main menu on error
-            await show_main_menu(update, context)
-            return CHOOSING_REPORT_TYPE
+        # Use the submitter remembered from an earlier search if available
+        user_id = context.user_data.get('report_user_ids', {}).get(report_id)
         
-        # Get the report submitter's user ID
-        user_id = report.get('user_id')
+        if not user_id:
+            # Get report from database
+            report = context.user_data.get('contact_report')
+            if not report:
+                report = await get_report(report_id)
+            
+            if not report:
+                await update.message.reply_text(
+                    "❌ Error: Report not found. Please try again."
+                )
+                # Return to main menu on error
+                await show_main_menu(update, context)
+                return CHOOSING_REPORT_TYPE
+            
+            # Get the report submitter's user ID
+            user_id = report.get('user_id')
         
         if not user_id:
             await update.message.reply_text(
@@ -1076,16 +1202,11 @@ async def send_message_to_submitter(update: Update, context: ContextTypes.DEFAUL
         try:
             # Format the message to include context - escape special characters for Markdown
             # Use escape_markdown_v2 from your utils to properly escape characters
-            safe_report_id = escape_markdown_v2(report_id)
-            safe_message = escape_markdown_v2(message)
-            safe_name = escape_markdown_v2(update.effective_user.first_name)
-            safe_username = escape_markdown_v2(update.effective_user.username or 'no_username')
-            
-            formatted_message = (
-                f"*Message regarding your report ID: {safe_report_id}*\n\n"
-                f"{safe_message}\n\n"
-                f"From: {safe_name} (@{safe_username})\n"
-                f"Contact them directly for more information\\."
+            formatted_message = SUBMITTER_MESSAGE_TEMPLATE.format(
+                report_id=escape_markdown_v2(report_id),
+                message=escape_markdown_v2(message),
+                name=escape_markdown_v2(update.effective_user.first_name),
+                username=escape_markdown_v2(update.effective_user.username or 'no_username')
             )
             
             # Send the message to the submitter
@@ -1105,7 +1226,7 @@ async def send_message_to_submitter(update: Update, context: ContextTypes.DEFAUL
             return CHOOSING_REPORT_TYPE
             
         except Exception as e:
-            logger.error(f"Error sending message to user {user_id}: {str(e)}")
+            logger.error("Error sending message to user %s: %s", user_id, e)
             await update.message.reply_text(
                 "❌ Failed to send message. The user may have blocked the bot or deleted their account."
             )
@@ -1114,7 +1235,7 @@ async def send_message_to_submitter(update: Update, context: ContextTypes.DEFAUL
             return CHOOSING_REPORT_TYPE
             
     except Exception as e:
-        logger.error(f"Error in send_message_to_submitter: {str(e)}")
+        logger.error("Error in send_message_to_submitter: %s", e)
         await update.message.reply_text(
             "❌ An error occurred while sending the message. Please try again later."
         )
@@ -1128,10 +1249,20 @@ async def choose_report_to_contact(update: Update, context: ContextTypes.DEFAULT
     selection = update.message.text.strip()
     
     # Check if the message is directly a report ID format (e.g., MDY-3306AD)
-    if "-" in selection and any(prefix in selection.upper() for prefix in ['MDY', 'YGN', 'NPT', 'BGO', 'SGG', 'MGW', 'AYD', 'TNT', 'MON', 'SHN', 'KCH', 'KYH', 'KYN', 'CHN', 'RKH', 'OTHR']):
+    if "-" in selection and any(prefix in selection.upper() for prefix in REPORT_ID_PREFIXES):
         # User has entered a report ID directly, process it instead of expecting a number
         report_id = selection.upper()
         
+        # Skip the lookup if this report was already seen in a search
+        if context.user_data.get('report_user_ids', {}).get(report_id):
+            context.user_data['contact_report_id'] = report_id
+            await update.message.reply_text(
+                f"✅ Report ID: {report_id} found.\n\n"
+                f"Please enter the message you want to send to the submitter of this report:",
+                reply_markup=REMOVE_KEYBOARD
+            )
+            return SEND_MESSAGE
+        
         try:
             # Get the report directly using the ID
             report = await get_report(report_id)
@@ -1140,7 +1271,7 @@ async def choose_report_to_contact(update: Update, context: ContextTypes.DEFAULT
                 await update.message.reply_text(
                     f"❌ No report found with ID: {report_id}\n\n"
                     f"ID: {report_id} နှင့် အစီရင်ခံစာ မတွေ့ရှိပါ။",
-                    reply_markup=ReplyKeyboardRemove()
+                    reply_markup=REMOVE_KEYBOARD
                 )
                 # Return to main menu
                 await show_main_menu(update, context)
@@ -1154,16 +1285,16 @@ async def choose_report_to_contact(update: Update, context: ContextTypes.DEFAULT
             await update.message.reply_text(
                 f"✅ Report ID: {report_id} found.\n\n"
                 f"Please enter the message you want to send to the submitter of this report:",
-                reply_markup=ReplyKeyboardRemove()
+                reply_markup=REMOVE_KEYBOARD
             )
             
             return SEND_MESSAGE
         
         except Exception as e:
-            logger.error(f"Error finding report by ID in choose_report_to_contact: {str(e)}")
+            logger.error("Error finding report by ID in choose_report_to_contact: %s", e)
             await update.message.reply_text(
                 "❌ An error occurred while retrieving the report. Please try again later.",
-                reply_markup=ReplyKeyboardRemove()
+                reply_markup=REMOVE_KEYBOARD
             )
             # Return to main menu on error
             await show_main_menu(update, context)
@@ -1186,7 +1317,7 @@ async def choose_report_to_contact(update: Update, context: ContextTypes.DEFAULT
             await update.message.reply_text(
                 f"✅ Selected report ID: {report_id}\n\n"
                 f"Please enter the message you want to send to the submitter of this report:",
-                reply_markup=ReplyKeyboardRemove()
+                reply_markup=REMOVE_KEYBOARD
             )
             
             return SEND_MESSAGE
@@ -1207,17 +1338,9 @@ async def choose_report_to_contact(update: Update, context: ContextTypes.DEFAULT
 
 async def show_main_menu(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
     """Show the main menu after report completion"""
-    keyboard = [
-        ['လူပျောက်တိုင်မယ်', 'သတင်းပို့မယ်'],
-        ['အကူအညီတောင်းမယ်', 'အကူအညီပေးမယ်'],
-        ['ID နဲ့ လူရှာမယ်', 'သတင်းပို့သူ ကို ဆက်သွယ်ရန်'],
-        ['နာမည်နဲ့ လူပျောက်ရှာမယ်', 'အစီရင်ခံစာအခြေအနေပြင်ဆင်မယ်']
-    ]
-    reply_markup = ReplyKeyboardMarkup(keyboard, one_time_keyboard=False, resize_keyboard=True)
-
     await update.message.reply_text(
         "ဆက်လက်၍ မည်သည့်လုပ်ဆောင်ချက်ကို လုပ်ဆောင်လိုပါသလဲ?",
-        reply_markup=reply_markup
+        reply_markup=MAIN_MENU_MARKUP
     )
     
     # Return to CHOOSING_REPORT_TYPE state to handle the next menu selection
@@ -1225,172 +1348,373 @@ async def show_main_menu(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
 
 
 # Helper functions
+def run_in_background(coro, name: str = None) -> asyncio.Task:
+    """Schedule a coroutine without awaiting it, keeping a reference until it finishes."""
+    task = asyncio.create_task(coro, name=name)
+    _BACKGROUND_TASKS.add(task)
+    task.add_done_callback(_BACKGROUND_TASKS.discard)
+    return task
+
+def allow_report(user_id: int) -> bool:
+    """Record a report being started and return False if the user is over the rate limit."""
+    global _last_rate_prune
+    now = time.monotonic()
+
+    # Drop users with no activity in the last window so the map doesn't grow forever
+    if now - _last_rate_prune > REPORT_RATE_WINDOW:
+        for uid in [uid for uid, times in _REPORT_TIMESTAMPS.items() if now - times[-1] > REPORT_RATE_WINDOW]:
+            del _REPORT_TIMESTAMPS[uid]
+        _last_rate_prune = now
+
+    times = _REPORT_TIMESTAMPS.get(user_id)
+    if times is None:
+        times = _REPORT_TIMESTAMPS[user_id] = deque(maxlen=REPORT_RATE_LIMIT)
+    elif len(times) == REPORT_RATE_LIMIT and now - times[0] < REPORT_RATE_WINDOW:
+        return False
+    times.append(now)
+    return True
+
+async def find_report(report_id: str):
+    """Look up a report in the database and the fallback stores.
+
+    Reports only reach REPORTS when their database save failed, so a memory hit
+    is returned without asking the database. Otherwise the database and the
+    local SQLite fallback are queried concurrently, preferring the database.
+    """
+    report = REPORTS.get(report_id)
+    if report is not None:
+        return report
+
+    db_report, fallback_report = await asyncio.gather(
+        get_report(report_id),
+        asyncio.to_thread(load_report, report_id)
+    )
+    if db_report:
+        return db_report
+    if fallback_report is not None:
+        REPORTS[report_id] = fallback_report
+    return fallback_report
+
+async def reply_with_photo(message, text: str, parse_mode, photo_id=None) -> None:
+    """Reply with report text and its photo, as one captioned photo when the text fits."""
+    if photo_id and len(text) <= CAPTION_LIMIT:
+        try:
+            await message.reply_photo(photo_id, caption=text, parse_mode=parse_mode)
+            return
+        except Exception as photo_error:
+            logger.error("Error sending photo with caption: %s", photo_error)
+            await message.reply_text(text, parse_mode=parse_mode)
+            await message.reply_text("📷 This report has a photo but it could not be displayed.")
+            return
+
+    if not photo_id:
+        await message.reply_text(text, parse_mode=parse_mode)
+        return
+
+    # Text and photo are independent replies, so send them concurrently
+    await asyncio.gather(
+        message.reply_text(text, parse_mode=parse_mode),
+        _reply_photo_or_notice(message, photo_id)
+    )
+
+async def _reply_photo_or_notice(message, photo_id) -> None:
+    """Reply with a stored photo, or a short notice if Telegram can't send it."""
+    try:
+        # Try to send the photo directly using Telegram's storage
+        await message.reply_photo(photo_id)
+    except Exception as photo_error:
+        logger.error("Error sending photo: %s", photo_error)
+        await message.reply_text("📷 This report has a photo but it could not be displayed.")
+
+# Free-text instructions per report type, used by get_instructions_by_type
+_INSTRUCTIONS = {
+    "Missing Person (Earthquake)": (
+        "*လူပျောက်အစီရင်ခံစာ*\n\n"
+        "ကျေးဇူးပြု၍ အောက်ပါအချက်အလက်များကို တစ်ခုတည်းသော စာတစ်စောင်တွင် ပေးပို့ပါ -\n\n"
+        "1. ပျောက်ဆုံးသူအမည်\n"
+        "2. အသက်\n"
+        "3. ကျား/မ\n"
+        "4. ကိုယ်ခန္ဓာဖော်ပြချက် (အရပ်၊ ကိုယ်ခန္ဓာဖွဲ့စည်းပုံ၊ ဝတ်ဆင်ထားသော အဝတ်အစား စသည်)\n"
+        "5. နောက်ဆုံးတွေ့ရှိခဲ့သည့်နေရာ (တတ်နိုင်သမျှ တိကျစွာ ဖော်ပြပါ)\n"
+        "6. နောက်ဆုံးတွေ့ရှိခဲ့သည့်အချိန် (ရက်စွဲ/အချိန်)\n"
+        "7. ဆေးဝါးအခြေအနေ သို့မဟုတ် အထူးလိုအပ်ချက်များ\n"
+        "8. သင့်ဆက်သွယ်ရန်အချက်အလက်\n\n"
+        "*ဥပမာ:*\n"
+        "1. အောင်ကို\n"
+        "2. ၃၅\n"
+        "3. ကျား\n" 
+        "4. အရပ်မြင့် (၅ပေ ၁၀လက်မ)၊ ပိန်ပိန်ပါး၊ ဆံပင်အမည်း၊ ဂျင်းဘောင်းဘီ အပြာနှင့် တီရှပ်အနီဝတ်ဆင်ထား\n"
+        "5. နောက်ဆုံး ဆူးလေစတုရန်းမော်လ် ဒုတိယထပ် စားသောက်ဆိုင်အနီးတွင် တွေ့ရှိခဲ့\n"
+        "6. နိုဝင်ဘာ ၂၆၊ ၂၀၂၃ - ညနေ ၂:၃၀ ခန့်\n"
+        "7. ဆီးချိုရောဂါရှိ၊ ပုံမှန်ဆေးသောက်ရန်လို\n"
+        "8. ဆက်သွယ်ရန် - သူသူ (ညီမ) - ၀၉၁၂၃၄၅၆၇၈၉\n\n"
+        "*မှတ်ချက်:* နောက်အဆင့်တွင် ဓာတ်ပုံထည့်သွင်းနိုင်ပါသည်။"
+    ),
+    "Found Person (Earthquake)": (
+        "*လူတွေ့ရှိမှု အစီရင်ခံစာ*\n\n"
+        "ကျေးဇူးပြု၍ အောက်ပါအချက်အလက်များကို တစ်ခုတည်းသော စာတစ်စောင်တွင် ပေးပို့ပါ -\n\n"
+        "1. တွေ့ရှိသူ၏ အမည် (သိရှိပါက)\n"
+        "2. ခန့်မှန်းအသက်\n"
+        "3. ကျား/မ\n"
+        "4. ကိုယ်ခန္ဓာဖော်ပြချက် (အရပ်၊ ကိုယ်ခန္ဓာဖွဲ့စည်းပုံ၊ ဝတ်ဆင်ထားသော အဝတ်အစား စသည်)\n"
+        "5. တွေ့ရှိခဲ့သည့်နေရာ\n"
+        "6. လက်ရှိတည်နေရာ/အခြေအနေ\n"
+        "7. ဒဏ်ရာရရှိမှု သို့မဟုတ် ဆေးဝါးလိုအပ်ချက်များ\n"
+        "8. သင့်ဆက်သွယ်ရန်အချက်အလက်\n\n"
+        "*ဥပမာ:*\n"
+        "1. အမည်မသိ၊ သူမအမည် မဟာ ဖြစ်နိုင်သည်ဟု ပြောပါသည်\n"
+        "2. အသက် ၂၅-၃၀ ခန့်\n"
+        "3. မ\n"
+        "4. အလယ်အလတ်အရပ်၊ ပိန်ပိန်သွယ်သွယ်၊ ဆံပင်ရှည် အမည်း၊ အကျႌဖြူနှင့် ထဘီ အပြာ ဝတ်ဆင်ထား\n"
+        "5. အဆောက်အဦးမှ စစ်ဆေးရေး ချိန်တွင် ရူဘီမတ် အနီးတွင် တွေ့ရှိခဲ့\n"
+        "6. လက်ရှိတွင် ရန်ကုန်အထွေထွေဆေးရုံကြီး၊ အရေးပေါ်ဌာနတွင် ရှိပါသည်\n"
+        "7. လက်မောင်းတွင် အနည်းငယ် ဒဏ်ရာရထားပြီး သတိလစ်သလို ဖြစ်နေပါသည်\n"
+        "8. ဆက်သွယ်ရန် - ဒေါက်တာသန့်၊ ရန်ကုန်အထွေထွေဆေးရုံကြီး - ၀၉၉၈၇၆၅၄၃၂၁\n\n"
+        "*မှတ်ချက်:* နောက်အဆင့်တွင် ဓာတ်ပုံထည့်သွင်းနိုင်ပါသည်။"
+    ),
+    "Request Rescue": (
+        "*ကယ်ဆယ်ရေးတောင်းဆိုချက်*\n\n"
+        "ကျေးဇူးပြု၍ အောက်ပါအချက်အလက်များကို တစ်ခုတည်းသော စာတစ်စောင်တွင် ပေးပို့ပါ -\n\n"
+        "1. တိကျသော တည်နေရာ (တတ်နိုင်သမျှ အသေးစိတ်ဖော်ပြပါ)\n"
+        "2. ကယ်ဆယ်ရန် လိုအပ်သူ အရေအတွက်\n"
+        "3. ဒဏ်ရာရရှိမှု သို့မဟုတ် ဆေးဝါးလိုအပ်ချက်များ\n"
+        "4. လက်ရှိအခြေအနေ (ပိတ်မိနေခြင်း၊ မလုံခြုံသော အဆောက်အအုံ စသည်)\n"
+        "5. သင့်ဆက်သွယ်ရန်အချက်အလက်\n\n"
+        "*ဥပမာ:*\n"
+        "1. အမှတ် ၁၂၃၊ ဗိုလ်ချုပ်လမ်း၊ ကျောက်တံတားမြို့နယ်၊ ရန်ကုန်။ သုံးထပ်တိုက် အဖြူရောင် အိမ်၊ တံခါးအပြာရောင်၊ ဒုတိယထပ် တိုက်ခန်းတွင် ပိတ်မိနေပါသည်\n"
+        "2. ၄ ဦး (လူကြီး ၂ ဦး၊ ကလေး ၂ ဦး အသက် ၇ နှစ်နှင့် ၃ နှစ်)\n"
+        "3. အသက်ကြီးသော အမျိုးသမီးတစ်ဦးမှာ နှလုံးရောဂါရှိ၍ ဆေးလိုအပ်ပါသည်၊ အခြားသူများမှာ ဒဏ်ရာမရှိပါ\n"
+        "4. အဆောက်အအုံ တစ်စိတ်တစ်ပိုင်း ပြိုကျထား၊ လှေကားကို အပျက်အစီးများက ပိတ်ဆို့နေ၊ ကျွန်ုပ်တို့သည် အရှေ့မြောက်ဘက်ထောင့်ခန်းတွင် ရှိနေပါသည်\n"
+        "5. ဆက်သွယ်ရန် - ကိုအောင် - ၀၉၅၅၅၁၂၃၄၅၆ (ဖုန်းလိုင်းအားနည်းသော်လည်း SMS အလုပ်လုပ်ပါသည်)\n\n"
+        "*မှတ်ချက်:* နောက်အဆင့်တွင် ဓာတ်ပုံထည့်သွင်းနိုင်ပါသည်။"
+    ),
+    "Offer Help": (
+        "*အကူအညီပေးရန် ကမ်းလှမ်းမှု*\n\n"
+        "ကျေးဇူးပြု၍ အောက်ပါအချက်အလက်များကို တစ်ခုတည်းသော စာတစ်စောင်တွင် ပေးပို့ပါ -\n\n"
+        "1. ပေးဆောင်နိုင်သည့် အကူအညီအမျိုးအစား (ကယ်ဆယ်ရေး၊ ဆေးဝါး၊ ပစ္စည်းများ စသည်)\n"
+        "2. သင့်တည်နေရာ\n"
+        "3. ရရှိနိုင်သော အရင်းအမြစ်များ (ယာဉ်များ၊ ပစ္စည်းကိရိယာများ စသည်)\n"
+        "4. သင့်ဆက်သွယ်ရန်အချက်အလက်\n\n"
+        "*ဥပမာ:*\n"
+        "1. ဆေးဝါးအကူအညီနှင့် ရှေးဦးသူနာပြုစုခြင်း၊ အသေးစား ဒဏ်ရာများနှင့် အခြေခံအရေးပေါ်စောင့်ရှောက်မှုတွင် ကူညီနိုင်\n"
+        "2. လက်ရှိတွင် ရွှေလမ်း၊ ဗဟန်းမြို့နယ်၊ ရန်ကုန်တွင် ရှိပါသည်\n"
+        "3. ဆေးဝါးပစ္စည်းများ၊ ရှေးဦးသူနာပြုစုခြင်းပစ္စည်းများ ရှိပြီး ဆိုင်ကယ်ဖြင့် ဒေသများသို့ သွားလာနိုင်ပါသည်\n"
+        "4. ဆက်သွယ်ရန် - ဒေါက်တာဝင်းမြင့် - ၀၉၁၂၃၇၈၉၄၅၆၊ ၂၄ နာရီ အဆင်သင့်ရှိပါသည်\n\n"
+        "*မှတ်ချက်:* နောက်အဆင့်တွင် ဓာတ်ပုံထည့်သွင်းနိုင်ပါသည်။"
+    )
+}
+_DEFAULT_INSTRUCTIONS = "ကျေးဇူးပြု၍ ဆက်စပ်သော အချက်အလက်အားလုံးကို စာတစ်စောင်တည်းတွင် ပေးပို့ပါ။"
+
 def get_instructions_by_type(report_type):
     """Return instructions based on report type."""
-    instructions = {
-        "Missing Person (Earthquake)": (
-            "*လူပျောက်အစီရင်ခံစာ*\n\n"
-            "ကျေးဇူးပြု၍ အောက်ပါအချက်အလက်များကို တစ်ခုတည်းသော စာတစ်စောင်တွင် ပေးပို့ပါ -\n\n"
-            "1. ပျောက်ဆုံးသူအမည်\n"
-            "2. အသက်\n"
-            "3. ကျား/မ\n"
-            "4. ကိုယ်ခန္ဓာဖော်ပြချက် (အရပ်၊ ကိုယ်ခန္ဓာဖွဲ့စည်းပုံ၊ ဝတ်ဆင်ထားသော အဝတ်အစား စသည်)\n"
-            "5. နောက်ဆုံးတွေ့ရှိခဲ့သည့်နေရာ (တတ်နိုင်သမျှ တိကျစွာ ဖော်ပြပါ)\n"
-            "6. နောက်ဆုံးတွေ့ရှိခဲ့သည့်အချိန် (ရက်စွဲ/အချိန်)\n"
-            "7. ဆေးဝါးအခြေအနေ သို့မဟုတ် အထူးလိုအပ်ချက်များ\n"
-            "8. သင့်ဆက်သွယ်ရန်အချက်အလက်\n\n"
-            "*ဥပမာ:*\n"
-            "1. အောင်ကို\n"
-            "2. ၃၅\n"
-            "3. ကျား\n" 
-            "4. အရပ်မြင့် (၅ပေ ၁၀လက်မ)၊ ပိန်ပိန်ပါး၊ ဆံပင်အမည်း၊ ဂျင်းဘောင်းဘီ အပြာနှင့် တီရှပ်အနီဝတ်ဆင်ထား\n"
-            "5. နောက်ဆုံး ဆူးလေစတုရန်းမော်လ် ဒုတိယထပ် စားသောက်ဆိုင်အနီးတွင် တွေ့ရှိခဲ့\n"
-            "6. နိုဝင်ဘာ ၂၆၊ ၂၀၂၃ - ညနေ ၂:၃၀ ခန့်\n"
-            "7. ဆီးချိုရောဂါရှိ၊ ပုံမှန်ဆေးသောက်ရန်လို\n"
-            "8. ဆက်သွယ်ရန် - သူသူ (ညီမ) - ၀၉၁၂၃၄၅၆၇၈၉\n\n"
-            "*မှတ်ချက်:* နောက်အဆင့်တွင် ဓာတ်ပုံထည့်သွင်းနိုင်ပါသည်။"
-        ),
-        "Found Person (Earthquake)": (
-            "*လူတွေ့ရှိမှု အစီရင်ခံစာ*\n\n"
-            "ကျေးဇူးပြု၍ အောက်ပါအချက်အလက်များကို တစ်ခုတည်းသော စာတစ်စောင်တွင် ပေးပို့ပါ -\n\n"
-            "1. တွေ့ရှိသူ၏ အမည် (သိရှိပါက)\n"
-            "2. ခန့်မှန်းအသက်\n"
-            "3. ကျား/မ\n"
-            "4. ကိုယ်ခန္ဓာဖော်ပြချက် (အရပ်၊ ကိုယ်ခန္ဓာဖွဲ့စည်းပုံ၊ ဝတ်ဆင်ထားသော အဝတ်အစား စသည်)\n"
-            "5. တွေ့ရှိခဲ့သည့်နေရာ\n"
-            "6. လက်ရှိတည်နေရာ/အခြေအနေ\n"
-            "7. ဒဏ်ရာရရှိမှု သို့မဟုတ် ဆေးဝါးလိုအပ်ချက်များ\n"
-            "8. သင့်ဆက်သွယ်ရန်အချက်အလက်\n\n"
-            "*ဥပမာ:*\n"
-            "1. အမည်မသိ၊ သူမအမည် မဟာ ဖြစ်နိုင်သည်ဟု ပြောပါသည်\n"
-            "2. အသက် ၂၅-၃၀ ခန့်\n"
-            "3. မ\n"
-            "4. အလယ်အလတ်အရပ်၊ ပိန်ပိန်သွယ်သွယ်၊ ဆံပင်ရှည် အမည်း၊ အကျႌဖြူနှင့် ထဘီ အပြာ ဝတ်ဆင်ထား\n"
-            "5. အဆောက်အဦးမှ စစ်ဆေးရေး ချိန်တွင် ရူဘီမတ် အနီးတွင် တွေ့ရှိခဲ့\n"
-            "6. လက်ရှိတွင် ရန်ကုန်အထွေထွေဆေးရုံကြီး၊ အရေးပေါ်ဌာနတွင် ရှိပါသည်\n"
-            "7. လက်မောင်းတွင် အနည်းငယ် ဒဏ်ရာရထားပြီး သတိလစ်သလို ဖြစ်နေပါသည်\n"
-            "8. ဆက်သွယ်ရန် - ဒေါက်တာသန့်၊ ရန်ကုန်အထွေထွေဆေးရုံကြီး - ၀၉၉၈၇၆၅၄၃၂၁\n\n"
-            "*မှတ်ချက်:* နောက်အဆင့်တွင် ဓာတ်ပုံထည့်သွင်းနိုင်ပါသည်။"
-        ),
-        "Request Rescue": (
-            "*ကယ်ဆယ်ရေးတောင်းဆိုချက်*\n\n"
-            "ကျေးဇူးပြု၍ အောက်ပါအချက်အလက်များကို တစ်ခုတည်းသော စာတစ်စောင်တွင် ပေးပို့ပါ -\n\n"
-            "1. တိကျသော တည်နေရာ (တတ်နိုင်သမျှ အသေးစိတ်ဖော်ပြပါ)\n"
-            "2. ကယ်ဆယ်ရန် လိုအပ်သူ အရေအတွက်\n"
-            "3. ဒဏ်ရာရရှိမှု သို့မဟုတ် ဆေးဝါးလိုအပ်ချက်များ\n"
-            "4. လက်ရှိအခြေအနေ (ပိတ်မိနေခြင်း၊ မလုံခြုံသော အဆောက်အအုံ စသည်)\n"
-            "5. သင့်ဆက်သွယ်ရန်အချက်အလက်\n\n"
-            "*ဥပမာ:*\n"
-            "1. အမှတ် ၁၂၃၊ ဗိုလ်ချုပ်လမ်း၊ ကျောက်တံတားမြို့နယ်၊ ရန်ကုန်။ သုံးထပ်တိုက် အဖြူရောင် အိမ်၊ တံခါးအပြာရောင်၊ ဒုတိယထပ် တိုက်ခန်းတွင် ပိတ်မိနေပါသည်\n"
-            "2. ၄ ဦး (လူကြီး ၂ ဦး၊ ကလေး ၂ ဦး အသက် ၇ နှစ်နှင့် ၃ နှစ်)\n"
-            "3. အသက်ကြီးသော အမျိုးသမီးတစ်ဦးမှာ နှလုံးရောဂါရှိ၍ ဆေးလိုအပ်ပါသည်၊ အခြားသူများမှာ ဒဏ်ရာမရှိပါ\n"
-            "4. အဆောက်အအုံ တစ်စိတ်တစ်ပိုင်း ပြိုကျထား၊ လှေကားကို အပျက်အစီးများက ပိတ်ဆို့နေ၊ ကျွန်ုပ်တို့သည် အရှေ့မြောက်ဘက်ထောင့်ခန်းတွင် ရှိနေပါသည်\n"
-            "5. ဆက်သွယ်ရန် - ကိုအောင် - ၀၉၅၅၅၁၂၃၄၅၆ (ဖုန်းလိုင်းအားနည်းသော်လည်း SMS အလုပ်လုပ်ပါသည်)\n\n"
-            "*မှတ်ချက်:* နောက်အဆင့်တွင် ဓာတ်ပုံထည့်သွင်းနိုင်ပါသည်။"
-        ),
-        "Offer Help": (
-            "*အကူအညီပေးရန် ကမ်းလှမ်းမှု*\n\n"
-            "ကျေးဇူးပြု၍ အောက်ပါအချက်အလက်များကို တစ်ခုတည်းသော စာတစ်စောင်တွင် ပေးပို့ပါ -\n\n"
-            "1. ပေးဆောင်နိုင်သည့် အကူအညီအမျိုးအစား (ကယ်ဆယ်ရေး၊ ဆေးဝါး၊ ပစ္စည်းများ စသည်)\n"
-            "2. သင့်တည်နေရာ\n"
-            "3. ရရှိနိုင်သော အရင်းအမြစ်များ (ယာဉ်များ၊ ပစ္စည်းကိရိယာများ စသည်)\n"
-            "4. သင့်ဆက်သွယ်ရန်အချက်အလက်\n\n"
-            "*ဥပမာ:*\n"
-            "1. ဆေးဝါးအကူအညီနှင့် ရှေးဦးသူနာပြုစုခြင်း၊ အသေးစား ဒဏ်ရာများနှင့် အခြေခံအရေးပေါ်စောင့်ရှောက်မှုတွင် ကူညီနိုင်\n"
-            "2. လက်ရှိတွင် ရွှေလမ်း၊ ဗဟန်းမြို့နယ်၊ ရန်ကုန်တွင် ရှိပါသည်\n"
-            "3. ဆေးဝါးပစ္စည်းများ၊ ရှေးဦးသူနာပြုစုခြင်းပစ္စည်းများ ရှိပြီး ဆိုင်ကယ်ဖြင့် ဒေသများသို့ သွားလာနိုင်ပါသည်\n"
-            "4. ဆက်သွယ်ရန် - ဒေါက်တာဝင်းမြင့် - ၀၉၁၂၃၇၈၉၄၅၆၊ ၂၄ နာရီ အဆင်သင့်ရှိပါသည်\n\n"
-            "*မှတ်ချက်:* နောက်အဆင့်တွင် ဓာတ်ပုံထည့်သွင်းနိုင်ပါသည်။"
-        )
-    }
-    
-    return instructions.get(report_type, "ကျေးဇူးပြု၍ ဆက်စပ်သော အချက်အလက်အားလုံးကို စာတစ်စောင်တည်းတွင် ပေးပို့ပါ။")
+    return _INSTRUCTIONS.get(report_type, _DEFAULT_INSTRUCTIONS)
+
+@functools.lru_cache(maxsize=4096)
+def format_myanmar_time(created_at) -> str:
+    """Convert an ISO timestamp string or datetime to a display string in Myanmar time.
+
+    Cached since the same reports are searched repeatedly; assumes UTC when no timezone is given.
+    """
+    if isinstance(created_at, str):
+        # Python 3.11+ fromisoformat accepts the trailing 'Z' directly
+        created_at = datetime.fromisoformat(created_at)
+    if created_at.tzinfo is None:
+        created_at = created_at.replace(tzinfo=UTC)
+    return created_at.astimezone(MYANMAR_TZ).strftime(TIMESTAMP_FORMAT) + " (Asia/Yangon)"
+
+def generate_report_id(prefix: str = '') -> str:
+    """Generate a random report ID, e.g. MDY-3306AD with a location prefix or 1A2B3C4D without."""
+    if prefix:
+        return f"{prefix.upper()}-{secrets.token_hex(3).upper()}"
+    return secrets.token_hex(4).upper()
+
+def get_status_emoji(status: str) -> str:
+    """Pick the emoji for a status, falling back to a keyword scan for non-standard values."""
+    emoji = STATUS_EMOJI.get(status)
+    if emoji is not None:
+        return emoji
+    for keyword, emoji in _STATUS_EMOJI_KEYWORDS:
+        if keyword in status:
+            return emoji
+    return "❓"
 
-def determine_urgency(text: str) -> str:
-    """Determine urgency level based on text content. Used as fallback."""
-    text = text.lower()
-    if "critical" in text or "emergency" in text or "urgent" in text or "life threatening" in text:
-        return "Critical (Medical Emergency)"
-    elif "high" in text or "trapped" in text or "injured" in text:
-        return "High (Trapped/Missing)"
-    elif "medium" in text or "safe" in text:
-        return "Medium (Safe but Separated)"
-    return "Low (Information Only)"
+def extract_name(all_data: str) -> str:
+    """Extract the person's name from report details. The name is always on the first line."""
+    match = _NAME_RE.match(all_data)
+    return match.group(1).strip() if match else "Unknown"
 
 def format_report_message(user_data: dict, report_id: str, priority_icon: str, timestamp: str, user) -> str:
     """Format the report message for Telegram channels using HTML instead of Markdown."""
-    location_info = ""
+    # Only user-supplied fields need escaping; the sections themselves are static HTML
+    parts = [_REPORT_HEADER_SECTION.format(
+        priority_icon=priority_icon,
+        report_type=html.escape(user_data['report_type'].upper(), quote=False),
+        report_id=html.escape(report_id, quote=False)
+    )]
     if user_data.get('location'):
-        location_info = f"📍 <b>LOCATION / တည်နေရာ:</b>\n<code>{user_data['location']}</code>\n\n"
+        parts.append(_LOCATION_SECTION.format(location=html.escape(user_data['location'], quote=False)))
+    parts.append(_DETAILS_SECTION.format(details=html.escape(user_data['all_data'].strip(), quote=False)))
+    if user_data.get('photo_url'):
+        parts.append(_PHOTO_SECTION.format(photo_url=html.escape(user_data['photo_url'])))
 
-    report_type_header = f"{priority_icon} <b>{user_data['report_type'].upper()}</b> {priority_icon}"
-    
     # Use user_data instead of report for urgency
     urgency_level = user_data.get('urgency', 'N/A')
-    urgency_emoji = "🔴" if "Critical" in urgency_level else "🟠" if "High" in urgency_level else "🟡" if "Medium" in urgency_level else "🟢"
-    
-    # Format the details with better spacing
-    details = user_data['all_data'].strip()
+    parts.append(_REPORT_FOOTER_SECTION.format(
+        urgency_emoji=PRIORITIES.get(urgency_level, "🟢"),
+        urgency_level=html.escape(urgency_level, quote=False),
+        timestamp=timestamp,
+        reporter=html.escape(f"{user.first_name} {user.last_name or ''}", quote=False)
+    ))
+    return "".join(parts)
 
-    # Add photo URL info if available
-    photo_info = ""
-    if user_data.get('photo_url'):
-        photo_info = f"📷 <b>PHOTO / ဓာတ်ပုံ:</b> <a href='{user_data['photo_url']}'>View Photo</a>\n\n"
-
-    return (
-        f"{report_type_header}\n"
-        f"\n\n"
-        f"🆔 <b>REPORT ID / အစီရင်ခံအမှတ်:</b>\n<code>{report_id}</code>\n\n"
-        f"{location_info}"
-        f"ℹ️ <b>DETAILS / အသေးစိတ်:</b>\n<code>{details}</code>\n\n"  # Changed <p> to <code>
-        f"{photo_info}"
-        f"{urgency_emoji} <b>URGENCY / အရေးပေါ်အဆင့်:</b>\n<code>{urgency_level}</code>\n\n"
-        f"⏰ <b>REPORTED / အချိန်:</b>\n<code>{timestamp} (Asia/Yangon)</code>\n\n"
-        f"👤 <b>REPORTED BY / တင်သွင်းသူ:</b>\n<code>{user.first_name} {user.last_name or ''}</code>\n\n"
+def store_report(report_id: str, user_data: dict, user, timestamp: str, safe_message: str = '') -> None:
+    """Store report in memory, along with its pre-formatted channel message."""
+    record = REPORTS[report_id] = ReportRecord(
+        report_id=report_id,
+        report_type=sys.intern(user_data['report_type']),
+        all_data=user_data['all_data'].strip(),
+        urgency=sys.intern(user_data['urgency']),
+        created_at=timestamp,
+        created_ns=time.time_ns(),
+        photo_id=user_data.get('photo_id'),
+        photo_url=user_data.get('photo_url'),
+        photo_path=user_data.get('photo_path'),
+        user_id=user.id,
+        username=sys.intern(user.username) if user.username else None,
+        first_name=user.first_name,
+        last_name=user.last_name,
+        location=sys.intern(user_data.get('location', 'Unknown')),
+        status=user_data.get('status', 'Still Missing'),
+        safe_message=safe_message
     )
+    # Keep a copy on disk so the report survives restarts and eviction from REPORTS
+    run_in_background(asyncio.to_thread(persist_report, record), name=f'persist_report:{report_id}')
 
-def store_report(report_id: str, user_data: dict, user, timestamp: str) -> None:
-    """Store report in memory."""
-    REPORTS[report_id] = {
-        'report_type': user_data['report_type'],
-        'all_data': user_data['all_data'],
-        'urgency': user_data['urgency'],
-        'timestamp': timestamp,
-        'photo_id': user_data.get('photo_id'),
-        'photo_url': user_data.get('photo_url'),
-        'photo_path': user_data.get('photo_path'),
-        'user_id': user.id,
-        'username': user.username,
-        'location': user_data.get('location', 'Unknown'),
-        'status': user_data.get('status', 'Still Missing')  # Add status field with default
-    }
+async def _post_to_channel(bot, photo_id, safe_message: str,
+                           _photo_messages=_CHANNEL_PHOTO_MESSAGES,
+                           _send_kwargs=_CHANNEL_SEND_KWARGS,
+                           _chat_id=CHANNEL_ID) -> None:
+    """Make a single attempt at posting a report to the channel.
 
-async def send_report_to_channel(bot, user_data: dict, safe_message: str) -> None:
-    """Send report to the channel."""
-    if not CHANNEL_ID:
+    The underscore parameters bind module settings once at definition time;
+    callers never pass them.
+    """
+    if photo_id in _photo_messages:
+        # Same photo already posted: copy that message instead of sending the photo again
+        await bot.copy_message(
+            from_chat_id=_chat_id,
+            message_id=_photo_messages[photo_id],
+            caption=safe_message,
+            **_send_kwargs
+        )
+    elif photo_id:
+        message = await bot.send_photo(photo=photo_id, caption=safe_message, **_send_kwargs)
+        _photo_messages[photo_id] = message.message_id
+    else:
+        await bot.send_message(text=safe_message, **_send_kwargs)
+
+def queue_channel_post(bot, user_data: dict, safe_message: str) -> None:
+    """Queue a report for the channel worker, starting the worker if it isn't running."""
+    global _CHANNEL_QUEUE, _CHANNEL_WORKER
+    if not _CHANNEL_ENABLED:
         logger.warning("No channel ID configured. Report not sent to channel.")
         return
-    
+    if _CHANNEL_QUEUE is None:
+        _CHANNEL_QUEUE = asyncio.Queue(maxsize=_CHANNEL_QUEUE_SIZE)
+    if _CHANNEL_WORKER is None or _CHANNEL_WORKER.done():
+        _CHANNEL_WORKER = run_in_background(_channel_worker(), name='channel_worker')
+
     try:
-        if user_data.get('photo_id'):
-            await bot.send_photo(
-                chat_id=CHANNEL_ID,
-                photo=user_data['photo_id'],
-                caption=safe_message,
-                parse_mode=ParseMode.HTML
-            )
-        else:
-            await bot.send_message(
-                chat_id=CHANNEL_ID,
-                text=safe_message,
-                parse_mode=ParseMode.HTML
-            )
-        logger.info(f"Report sent to channel {CHANNEL_ID}")
-    except Exception as e:
-        logger.error(f"Failed to send report to channel: {str(e)}")
+        _CHANNEL_QUEUE.put_nowait((bot, user_data, safe_message))
+    except asyncio.QueueFull:
+        logger.error("Channel queue full, report %s not queued", user_data.get('report_id'))
+        _write_dead_letter(user_data, safe_message)
+
+async def _channel_worker() -> None:
+    """Send queued channel posts in small concurrent batches, paced to the channel rate limit."""
+    sent_at = deque()
+    while True:
+        batch = [await _CHANNEL_QUEUE.get()]
+
+        # Forget sends that have left the window; if it is still full, wait for the oldest to leave
+        now = time.monotonic()
+        while sent_at and now - sent_at[0] >= _CHANNEL_RATE_WINDOW:
+            sent_at.popleft()
+        if len(sent_at) >= _CHANNEL_RATE_LIMIT:
+            await asyncio.sleep(_CHANNEL_RATE_WINDOW - (now - sent_at[0]))
+            now = time.monotonic()
+            while sent_at and now - sent_at[0] >= _CHANNEL_RATE_WINDOW:
+                sent_at.popleft()
+
+        room = min(_CHANNEL_BATCH_SIZE, _CHANNEL_RATE_LIMIT - len(sent_at))
+        while len(batch) < room and not _CHANNEL_QUEUE.empty():
+            batch.append(_CHANNEL_QUEUE.get_nowait())
+        sent_at.extend([now] * len(batch))
+        await asyncio.gather(*(send_report_to_channel(*item) for item in batch))
+
+async def send_report_to_channel(bot, user_data: dict, safe_message: str) -> None:
+    """Send report to the channel.
+
+    Run by the channel worker (see queue_channel_post), so all errors are logged
+    here rather than raised. Flood-control and timeout errors are retried with
+    backoff; a post that still fails is appended to CHANNEL_DEAD_LETTER_FILE.
+    """
+    photo_id = user_data.get('photo_id')
+    for attempt in range(CHANNEL_SEND_ATTEMPTS):
+        try:
+            # Only the request holds a slot; retry sleeps below don't
+            async with _CHANNEL_SEND_LIMIT:
+                await _post_to_channel(bot, photo_id, safe_message)
+            logger.info("Report sent to channel %s", CHANNEL_ID)
+            return
+        except RetryAfter as e:
+            logger.warning("Channel flood control, retrying in %s seconds", e.retry_after)
+            await asyncio.sleep(float(e.retry_after) + random.random())
+        except BadRequest as e:
+            if _CHANNEL_PHOTO_MESSAGES.pop(photo_id, None) is None:
+                logger.error("Failed to send report to channel: %s", e)
+                break
+            # The cached channel message is gone; send the photo itself next time
+            logger.warning("Could not copy earlier channel post, resending photo: %s", e)
+        except (TimedOut, NetworkError) as e:
+            # BadRequest is a NetworkError too, so it is handled above
+            logger.warning("Channel send attempt %s failed: %s", attempt + 1, e)
+            await asyncio.sleep(2 ** attempt + random.random())
+        except Exception as e:
+            logger.error("Failed to send report to channel: %s", e)
+            break
+
+    _write_dead_letter(user_data, safe_message)
+
+def _write_dead_letter(user_data: dict, safe_message: str) -> None:
+    """Keep a channel post that could not be delivered so it can be re-sent by hand."""
+    entry = {
+        'report_id': user_data.get('report_id'),
+        'photo_id': user_data.get('photo_id'),
+        'message': safe_message,
+        'failed_at': datetime.now(UTC).isoformat()
+    }
+    try:
+        with open(CHANNEL_DEAD_LETTER_FILE, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        logger.error("Report %s not sent to channel, saved to %s", entry['report_id'], CHANNEL_DEAD_LETTER_FILE)
+    except OSError as e:
+        logger.error("Report %s not sent to channel and could not be saved: %s", entry['report_id'], e)
 
 def get_s3_client():
-    """Get configured S3 client for DigitalOcean Spaces"""
+    """Get configured S3 client for DigitalOcean Spaces, creating it on first successful use"""
+    global _S3_CLIENT
+    if _S3_CLIENT is not None:
+        return _S3_CLIENT
+
+    # Uploads call this from several executor threads; only one of them builds the client
+    with _S3_CLIENT_LOCK:
+        if _S3_CLIENT is None:
+            _S3_CLIENT = _build_s3_client()
+        return _S3_CLIENT
+
+def _build_s3_client():
+    """Create the S3 client and check the bucket, returning None on failure"""
     try:
         # Get credentials from environment variables
         endpoint_url = os.environ.get('DO_SPACES_ENDPOINT')
@@ -1399,7 +1723,7 @@ def get_s3_client():
         secret_key = os.environ.get('DO_SPACES_SECRET')
         
         # Debug log the configuration (without secrets)
-        logger.info(f"Connecting to Digital Ocean Spaces at {endpoint_url} in region {region_name}")
+        logger.info("Connecting to Digital Ocean Spaces at %s in region %s", endpoint_url, region_name)
         
         if not endpoint_url:
             logger.error("Missing DO_SPACES_ENDPOINT environment variable")
@@ -1416,38 +1740,45 @@ def get_s3_client():
             region_name=region_name,
             aws_access_key_id=access_key,
             aws_secret_access_key=secret_key,
-            config=Config(signature_version='s3v4')  # Use s3v4 instead of s3
+            # Use s3v4 instead of s3; keep connections alive and pooled for repeated uploads, and
+            # retry a failed request only once so a struggling endpoint doesn't hold up the report
+            config=Config(
+                signature_version='s3v4',
+                tcp_keepalive=True,
+                max_pool_connections=32,
+                retries={'max_attempts': 2, 'mode': 'standard'}
+            )
         )
         
         # Test connection with a simple operation
         try:
             # Instead of list_buckets, try a more specific operation for the bucket
-            bucket_name = os.environ.get('DO_SPACES_BUCKET', 'photos')
-            logger.info(f"Testing connection to bucket: {bucket_name}")
+            bucket_name = DO_SPACES_BUCKET
+            logger.info("Testing connection to bucket: %s", bucket_name)
             
             try:
                 # First try to check if the bucket exists
                 s3_client.head_bucket(Bucket=bucket_name)
-                logger.info(f"Successfully connected to Digital Ocean Spaces bucket: {bucket_name}")
+                logger.info("Successfully connected to Digital Ocean Spaces bucket: %s", bucket_name)
             except Exception as bucket_error:
                 # If the bucket doesn't exist, try to create it
-                logger.warning(f"Bucket check failed: {str(bucket_error)}")
-                logger.info(f"Attempting to create bucket: {bucket_name}")
+                logger.warning("Bucket check failed: %s", bucket_error)
+                logger.info("Attempting to create bucket: %s", bucket_name)
                 location = {'LocationConstraint': region_name}
                 s3_client.create_bucket(
                     Bucket=bucket_name,
                     ACL='public-read',
                     CreateBucketConfiguration=location
                 )
-                logger.info(f"Created bucket: {bucket_name}")
+                logger.info("Created bucket: %s", bucket_name)
             
             return s3_client
         except Exception as conn_error:
-            logger.error(f"Connection test to Digital Ocean Spaces failed: {str(conn_error)}")
+            logger.error("Connection test to Digital Ocean Spaces failed: %s", conn_error)
             return None
             
     except Exception as e:
-        logger.error(f"Error creating S3 client: {str(e)}")
+        logger.error("Error creating S3 client: %s", e)
         return None
 
 
@@ -1500,11 +1831,7 @@ async def collect_age(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int
         context.user_data['form_data']['age'] = text
         
         # Create keyboard for gender selection
-        keyboard = [
-            ['ကျား (Male)', 'မ (Female)'],
-            ['အခြား (Other)', 'မသိပါ (Unknown)']
-        ]
-        reply_markup = ReplyKeyboardMarkup(keyboard, one_time_keyboard=True, resize_keyboard=True)
+        reply_markup = GENDER_MARKUP
         
         if report_type == 'Missing Person (Earthquake)':
             await update.message.reply_text(
@@ -1538,17 +1865,17 @@ async def collect_gender(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
     if report_type == 'Missing Person (Earthquake)':
         await update.message.reply_text(
             "ပျောက်ဆုံးနေသူ၏ ကိုယ်ခန္ဓာဖော်ပြချက်ကို ရိုက်ထည့်ပါ (အရပ်၊ ဝတ်စားဆင်ယင်မှု၊ အခြားသိသာသော လက္ခဏာများ):",
-            reply_markup=ReplyKeyboardRemove()
+            reply_markup=REMOVE_KEYBOARD
         )
     elif report_type == 'Found Person (Earthquake)':
         await update.message.reply_text(
             "တွေ့ရှိထားသူ၏ ကိုယ်ခန္ဓာဖော်ပြချက်ကို ရိုက်ထည့်ပါ (အရပ်၊ ဝတ်စားဆင်ယင်မှု၊ အခြားသိသာသော လက္ခဏာများ):",
-            reply_markup=ReplyKeyboardRemove()
+            reply_markup=REMOVE_KEYBOARD
         )
     else:
         await update.message.reply_text(
             "ကိုယ်ခန္ဓာဖော်ပြချက်ကို ရိုက်ထည့်ပါ (အရပ်၊ ဝတ်စားဆင်ယင်မှု၊ အခြားသိသာသော လက္ခဏာများ):",
-            reply_markup=ReplyKeyboardRemove()
+            reply_markup=REMOVE_KEYBOARD
         )
     
     return COLLECT_DESCRIPTION
@@ -1629,7 +1956,7 @@ async def collect_exact_location(update: Update, context: ContextTypes.DEFAULT_T
             "တည်နေရာကို နံပါတ်အဖြစ် ရိုက်ထည့်ပါ (latitude, longitude)။\n\n"
             "ဥပမာ: 16.871311, 96.199379\n\n"
             "တည်နေရာနံပါတ်ရယူရန် Google Map တွင် သင်လိုသည့်တည်နေရာကို ကလစ်နှိပ်ပြီး ပေါ်လာသည့် နံပါတ်များကို ကူးယူပါ (Copy & Paste)။",
-            reply_markup=ReplyKeyboardRemove()
+            reply_markup=REMOVE_KEYBOARD
         )
         # Switch to a new state for collecting custom coordinates
         return COLLECT_CUSTOM_COORDINATES
@@ -1639,7 +1966,7 @@ async def collect_exact_location(update: Update, context: ContextTypes.DEFAULT_T
         context.user_data['form_data']['exact_coordinates'] = "Not provided"
         
         # Remove keyboard
-        reply_markup = ReplyKeyboardRemove()
+        reply_markup = REMOVE_KEYBOARD
         
         # Get the report type to determine the next step
         report_type = context.user_data.get('report_type', '')
@@ -1728,7 +2055,7 @@ async def collect_custom_coordinates(update: Update, context: ContextTypes.DEFAU
             )
             context.user_data['form_data']['exact_coordinates'] = "Not provided"
     except Exception as e:
-        logger.error(f"Error parsing custom coordinates: {str(e)}")
+        logger.error("Error parsing custom coordinates: %s", e)
         await update.message.reply_text(
             "❌ တည်နေရာနံပါတ် စစ်ဆေးရာတွင် အမှားအယွင်းရှိပါသည်။\n\n"
             "ဆက်လက်ရန် တည်နေရာကို ကျော်သွားပါမည်။",
@@ -1947,26 +2274,10 @@ async def collect_contact_info(update: Update, context: ContextTypes.DEFAULT_TYP
     )
     
     # Generate a unique report ID
-    prefix = context.user_data.get('case_prefix', '')
-    if prefix:
-        report_id = f"{prefix.upper()}-{str(uuid.uuid4())[:6].upper()}"
-    else:
-        report_id = str(uuid.uuid4())[:8].upper()
-        
-    context.user_data['report_id'] = report_id
+    report_id = context.user_data['report_id'] = generate_report_id(context.user_data.get('case_prefix', ''))
     
     # Create urgency selection keyboard
-    keyboard = [
-        ["အလွန်အရေးပေါ် (ဆေးကုသမှု လိုအပ်)"],
-        ["အရေးပေါ် (ပိတ်မိနေ/ပျောက်ဆုံး)"],
-        ["အလယ်အလတ် (လုံခြုံသော်လည်း ကွဲကွာနေ)"],
-        ["အရေးမကြီး (သတင်းအချက်အလက်သာ)"]
-    ]
-    reply_markup = ReplyKeyboardMarkup(
-        keyboard, 
-        one_time_keyboard=True, 
-        resize_keyboard=True
-    )
+    reply_markup = URGENCY_KEYBOARD_MARKUP
 
     await update.message.reply_text(
         f"အချက်အလက်များ ပေးပို့သည့်အတွက် ကျေးဇူးတင်ပါသည်။ သင့် အစီရင်ခံစာ ID မှာ: *{report_id}*\n\n"
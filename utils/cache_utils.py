@@ -0,0 +1,104 @@
+import time
+from collections import OrderedDict
+
+
+class LRUDict(OrderedDict):
+    """
+    OrderedDict that evicts the least recently stored entries once maxsize is exceeded.
+    
+    Args:
+        maxsize: Maximum number of entries to keep
+    """
+
+    def __init__(self, maxsize: int):
+        super().__init__()
+        self.maxsize = maxsize
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        while len(self) > self.maxsize:
+            self.popitem(last=False)
+
+
+class TTLDict(LRUDict):
+    """
+    LRUDict whose entries also expire ttl seconds after they were last stored.
+    
+    Args:
+        maxsize: Maximum number of entries to keep
+        ttl: Lifetime of an entry in seconds
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        super().__init__(maxsize)
+        self.ttl = ttl
+        self._expires = {}
+
+    def __setitem__(self, key, value):
+        now = time.monotonic()
+        self._expires[key] = now + self.ttl
+        super().__setitem__(key, value)
+        self.purge(now)
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._expires.pop(key, None)
+
+    def __getitem__(self, key):
+        if self._expired(key):
+            del self[key]
+            raise KeyError(key)
+        return super().__getitem__(key)
+
+    def __contains__(self, key):
+        if not super().__contains__(key):
+            return False
+        if self._expired(key):
+            del self[key]
+            return False
+        return True
+
+    def __len__(self):
+        self.purge()
+        return super().__len__()
+
+    def __iter__(self):
+        self.purge()
+        return super().__iter__()
+
+    def keys(self):
+        self.purge()
+        return super().keys()
+
+    def values(self):
+        self.purge()
+        return super().values()
+
+    def items(self):
+        self.purge()
+        return super().items()
+
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+
+    def pop(self, key, *default):
+        if key in self:
+            self._expires.pop(key, None)
+        return super().pop(key, *default)
+
+    def popitem(self, last=True):
+        key, value = super().popitem(last)
+        self._expires.pop(key, None)
+        return key, value
+
+    def _expired(self, key, now=None) -> bool:
+        expires = self._expires.get(key)
+        return expires is not None and expires <= (now if now is not None else time.monotonic())
+
+    def purge(self, now=None):
+        """Drop expired entries; they sit at the front since every store moves a key to the end"""
+        now = now if now is not None else time.monotonic()
+        # The base OrderedDict methods are used here because __len__ and __iter__ purge themselves
+        while OrderedDict.__len__(self) and self._expired(next(OrderedDict.__iter__(self)), now):
+            self.popitem(last=False)
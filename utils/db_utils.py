@@ -1,6 +1,8 @@
+import asyncio
 import os
 import logging
 from datetime import datetime
+from dataclasses import dataclass
 from typing import Dict, List, Optional, Any, Union
 from supabase import create_client, Client
 import psycopg2
@@ -9,10 +11,13 @@ from dotenv import load_dotenv
 import re
 from urllib.parse import urlparse
 import io
-import uuid
+import secrets
 import socket
 import time
 
+from config.constants import REPORTS_CACHE_SIZE, REPORTS_TTL
+from utils.cache_utils import TTLDict
+
 # Load environment variables from .env file if present
 load_dotenv()
 
@@ -42,7 +47,7 @@ def extract_pg_host_from_supabase_url(url: str) -> str:
         project_ref = hostname.split('.')[0]
         return f"db.{project_ref}.supabase.co"
     except Exception as e:
-        logger.error(f"Failed to extract PostgreSQL host from Supabase URL: {str(e)}")
+        logger.error("Failed to extract PostgreSQL host from Supabase URL: %s", e)
         return ""
 
 # PostgreSQL connection details
@@ -57,10 +62,40 @@ pg_database = os.environ.get("POSTGRES_DB", "postgres")
 pg_schema = os.environ.get("POSTGRES_SCHEMA", "public")
 pg_table = os.environ.get("POSTGRES_TABLE", "reports")
 
+@dataclass(slots=True)
+class ReportRecord:
+    """A report held in memory while the database is unavailable."""
+    report_type: str
+    all_data: str
+    urgency: str
+    user_id: Optional[int]
+    username: Optional[str]
+    report_id: str = ''
+    created_ns: int = 0  # time.time_ns() at creation, for cheap ordering
+    created_at: str = ''
+    first_name: Optional[str] = None
+    last_name: Optional[str] = None
+    location: str = 'Unknown'
+    status: str = 'Still Missing'
+    photo_id: Optional[str] = None
+    photo_url: Optional[str] = None
+    photo_path: Optional[str] = None
+    safe_message: str = ''
+
+    def get(self, key: str, default=None):
+        """Dict-style read so callers can treat database rows and records alike."""
+        return getattr(self, key, default)
+
 # Global variables to track if connections are ready
 db_ready = False
 pg_conn = None
-REPORTS = {}  # In-memory storage for reports when DB is unavailable
+# In-memory storage for reports when DB is unavailable. TTLDict has no lock, so it is
+# only read and written on the event loop thread, never from executors or to_thread
+REPORTS = TTLDict(maxsize=REPORTS_CACHE_SIZE, ttl=REPORTS_TTL)
+
+# Recent database hits from get_report, keyed by upper-cased report ID, so users
+# re-pasting the same ID don't cost another round trip; kept briefly since status changes
+_REPORT_LOOKUP_CACHE = TTLDict(maxsize=1024, ttl=60)
 
 # Initialize Supabase connection
 if not supabase_url or not supabase_key:
@@ -72,7 +107,7 @@ else:
         logger.info("Supabase client initialized successfully")
         db_ready = True
     except Exception as e:
-        logger.error(f"Failed to initialize Supabase client: {str(e)}")
+        logger.error("Failed to initialize Supabase client: %s", e)
         supabase = None
 
 # Function to ensure the required database schema is present
@@ -103,7 +138,7 @@ def ensure_schema_exists():
                 
                 # Create table if it doesn't exist
                 if not table_exists:
-                    logger.info(f"Creating table {pg_schema}.{pg_table}")
+                    logger.info("Creating table %s.%s", pg_schema, pg_table)
                     cursor.execute(f"""
                         CREATE TABLE {pg_schema}.{pg_table} (
                             id SERIAL PRIMARY KEY,
@@ -137,7 +172,7 @@ def ensure_schema_exists():
                     status_column_exists = cursor.fetchone()[0]
                     
                     if not status_column_exists:
-                        logger.info(f"Adding 'status' column to {pg_schema}.{pg_table}")
+                        logger.info("Adding 'status' column to %s.%s", pg_schema, pg_table)
                         cursor.execute(f"""
                             ALTER TABLE {pg_schema}.{pg_table}
                             ADD COLUMN status VARCHAR(100) DEFAULT 'Still Missing';
@@ -149,7 +184,7 @@ def ensure_schema_exists():
                 
         return False
     except Exception as e:
-        logger.error(f"Error ensuring schema exists: {str(e)}", exc_info=True)
+        logger.error("Error ensuring schema exists: %s", e, exc_info=True)
         return False
 
 # Function to check DNS resolution before attempting connection
@@ -164,7 +199,7 @@ def check_host_dns_resolution(hostname):
         Tuple of (is_resolvable, message) where is_resolvable is a boolean and message contains details
     """
     try:
-        logger.debug(f"Checking DNS resolution for: {hostname}")
+        logger.debug("Checking DNS resolution for: %s", hostname)
         ip_address = socket.gethostbyname(hostname)
         return True, f"Hostname {hostname} resolves to {ip_address}"
     except socket.gaierror as e:
@@ -207,12 +242,12 @@ def get_postgres_connection(direct_connect=False, max_retries=3, retry_delay=2):
         direct_database = os.environ.get("DIRECT_PG_DATABASE", pg_database)
         
         if direct_host:
-            logger.info(f"Attempting direct PostgreSQL connection to: {direct_host}")
+            logger.info("Attempting direct PostgreSQL connection to: %s", direct_host)
             
             # Check DNS resolution first
             resolvable, message = check_host_dns_resolution(direct_host)
             if not resolvable:
-                logger.error(f"DNS resolution check failed: {message}")
+                logger.error("DNS resolution check failed: %s", message)
                 logger.info("Will attempt connection anyway, but it's likely to fail")
             else:
                 logger.info(message)
@@ -238,26 +273,26 @@ def get_postgres_connection(direct_connect=False, max_retries=3, retry_delay=2):
                     retry_count += 1
                     
                     if "could not translate host name" in error_msg or "name or service not known" in error_msg:
-                        logger.error(f"DNS resolution error on attempt {retry_count}/{max_retries}: {e}")
+                        logger.error("DNS resolution error on attempt %s/%s: %s", retry_count, max_retries, e)
                         if retry_count <= max_retries:
-                            logger.info(f"Retrying in {current_delay} seconds...")
+                            logger.info("Retrying in %s seconds...", current_delay)
                             time.sleep(current_delay)
                             current_delay *= 2  # Exponential backoff
                         else:
-                            logger.error(f"Failed to resolve host after {max_retries} attempts")
+                            logger.error("Failed to resolve host after %s attempts", max_retries)
                     elif "timeout" in error_msg:
-                        logger.error(f"Connection timeout on attempt {retry_count}/{max_retries}: {e}")
+                        logger.error("Connection timeout on attempt %s/%s: %s", retry_count, max_retries, e)
                         if retry_count <= max_retries:
-                            logger.info(f"Retrying in {current_delay} seconds...")
+                            logger.info("Retrying in %s seconds...", current_delay)
                             time.sleep(current_delay)
                             current_delay *= 2  # Exponential backoff
                         else:
-                            logger.error(f"Connection timed out after {max_retries} attempts")
+                            logger.error("Connection timed out after %s attempts", max_retries)
                     else:
-                        logger.error(f"Failed to connect with direct PostgreSQL connection: {e}")
+                        logger.error("Failed to connect with direct PostgreSQL connection: %s", e)
                         break  # Don't retry for other errors
                 except Exception as e:
-                    logger.error(f"Unexpected error during PostgreSQL connection: {e}")
+                    logger.error("Unexpected error during PostgreSQL connection: %s", e)
                     break  # Don't retry for unexpected errors
     
     # Verify we have all the required connection parameters
@@ -272,15 +307,15 @@ def get_postgres_connection(direct_connect=False, max_retries=3, retry_delay=2):
     # Check DNS resolution before attempting connection
     resolvable, message = check_host_dns_resolution(pg_host)
     if not resolvable:
-        logger.error(f"DNS resolution check failed: {message}")
+        logger.error("DNS resolution check failed: %s", message)
         logger.error("Please check your network connection and DNS settings")
-        logger.error(f"The host name '{pg_host}' cannot be resolved to an IP address")
+        logger.error("The host name '%s' cannot be resolved to an IP address", pg_host)
         logger.info("Will attempt connection anyway, but it's likely to fail")
     else:
         logger.info(message)
     
     # Log connection attempt for debugging
-    logger.info(f"Attempting to connect to PostgreSQL at host: {pg_host}")
+    logger.info("Attempting to connect to PostgreSQL at host: %s", pg_host)
     
     # Try to connect with retry mechanism
     retry_count = 0
@@ -304,26 +339,26 @@ def get_postgres_connection(direct_connect=False, max_retries=3, retry_delay=2):
             retry_count += 1
             
             if "could not translate host name" in error_msg or "name or service not known" in error_msg:
-                logger.error(f"DNS resolution error on attempt {retry_count}/{max_retries}: {e}")
+                logger.error("DNS resolution error on attempt %s/%s: %s", retry_count, max_retries, e)
                 if retry_count <= max_retries:
-                    logger.info(f"Retrying in {current_delay} seconds...")
+                    logger.info("Retrying in %s seconds...", current_delay)
                     time.sleep(current_delay)
                     current_delay *= 2  # Exponential backoff
                 else:
-                    logger.error(f"Failed to resolve host after {max_retries} attempts")
+                    logger.error("Failed to resolve host after %s attempts", max_retries)
             elif "timeout" in error_msg:
-                logger.error(f"Connection timeout on attempt {retry_count}/{max_retries}: {e}")
+                logger.error("Connection timeout on attempt %s/%s: %s", retry_count, max_retries, e)
                 if retry_count <= max_retries:
-                    logger.info(f"Retrying in {current_delay} seconds...")
+                    logger.info("Retrying in %s seconds...", current_delay)
                     time.sleep(current_delay)
                     current_delay *= 2  # Exponential backoff
                 else:
-                    logger.error(f"Connection timed out after {max_retries} attempts")
+                    logger.error("Connection timed out after %s attempts", max_retries)
             else:
-                logger.error(f"Failed to connect to PostgreSQL: {e}")
+                logger.error("Failed to connect to PostgreSQL: %s", e)
                 break  # Don't retry for other errors
         except Exception as e:
-            logger.error(f"Unexpected error during PostgreSQL connection: {e}")
+            logger.error("Unexpected error during PostgreSQL connection: %s", e)
             break  # Don't retry for unexpected errors
     
     return None
@@ -350,7 +385,7 @@ def upload_photo_to_storage(photo_data: Union[str, bytes, io.BytesIO], file_name
     try:
         # Generate a unique file name if not provided
         if not file_name:
-            file_name = f"{uuid.uuid4()}.jpg"
+            file_name = f"{secrets.token_hex(16)}.jpg"
             
         bucket_name = os.environ.get("SUPABASE_STORAGE_BUCKET", "photos")
         
@@ -366,7 +401,7 @@ def upload_photo_to_storage(photo_data: Union[str, bytes, io.BytesIO], file_name
             # If photo_data is a BytesIO object
             file_data = photo_data.getvalue()
         else:
-            logger.error(f"Unsupported photo data type: {type(photo_data)}")
+            logger.error("Unsupported photo data type: %s", type(photo_data))
             return None
             
         # Create the bucket if it doesn't exist
@@ -386,15 +421,19 @@ def upload_photo_to_storage(photo_data: Union[str, bytes, io.BytesIO], file_name
         # Get the public URL
         file_url = supabase.storage.from_(bucket_name).get_public_url(file_name)
         
-        logger.info(f"Photo uploaded successfully: {file_url}")
+        logger.info("Photo uploaded successfully: %s", file_url)
         return file_url
     
     except Exception as e:
-        logger.error(f"Error uploading photo to storage: {str(e)}")
+        logger.error("Error uploading photo to storage: %s", e)
         return None
 
 def save_report(report_data: Dict[str, Any], telegram_user: Any) -> Optional[Dict[str, Any]]:
-    """Save a report to the database"""
+    """Save a report to the database.
+
+    Returns None when no database took the report; the caller then keeps it in
+    the in-memory and local SQLite fallback stores.
+    """
     # Ensure the schema exists with all required columns
     ensure_schema_exists()
     
@@ -421,14 +460,14 @@ def save_report(report_data: Dict[str, Any], telegram_user: Any) -> Optional[Dic
             response = supabase.table(pg_table).insert(data).execute()
             
             if response.data:
-                logger.info(f"Successfully saved report {report_data['report_id']} to database")
+                logger.info("Successfully saved report %s to database", report_data['report_id'])
                 return data
             else:
-                logger.error(f"Failed to save report to database: {response.error}")
+                logger.error("Failed to save report to database: %s", response.error)
                 return None
                 
     except Exception as e:
-        logger.warning(f"Error saving report via Supabase: {str(e)}. Trying direct PostgreSQL connection...")
+        logger.warning("Error saving report via Supabase: %s. Trying direct PostgreSQL connection...", e)
     
     # Fall back to direct PostgreSQL connection if Supabase fails
     try:
@@ -436,25 +475,7 @@ def save_report(report_data: Dict[str, Any], telegram_user: Any) -> Optional[Dic
         conn = get_postgres_connection(direct_connect=True)
         if conn is None:
             logger.error("Could not establish PostgreSQL connection")
-            # Save to in-memory storage as a last resort
-            REPORTS[report_data["report_id"]] = {
-                "report_id": report_data["report_id"],
-                "report_type": report_data["report_type"],
-                "all_data": report_data["all_data"],
-                "urgency": report_data["urgency"],
-                "photo_id": report_data.get("photo_id"),
-                "photo_url": report_data.get("photo_url"),
-                "photo_path": report_data.get("photo_path"),
-                "user_id": telegram_user.id,
-                "status": report_date.get("status"),
-                "username": telegram_user.username,
-                "first_name": telegram_user.first_name,
-                "last_name": telegram_user.last_name,
-                "location": report_data.get("location", "Unknown"),
-                "created_at": datetime.now().isoformat()
-            }
-            logger.info(f"Report stored in memory: {report_data['report_id']}")
-            return REPORTS[report_data["report_id"]]
+            return None
         
         cursor = conn.cursor(cursor_factory=RealDictCursor)
         
@@ -532,104 +553,14 @@ def save_report(report_data: Dict[str, Any], telegram_user: Any) -> Optional[Dic
         cursor.close()
         
         if result:
-            logger.info(f"Report saved successfully with ID: {report_data['report_id']} via PostgreSQL")
+            logger.info("Report saved successfully with ID: %s via PostgreSQL", report_data['report_id'])
             return dict(result)
         else:
             logger.error("No data returned from PostgreSQL after insert")
-            # Save to in-memory storage as a last resort
-            REPORTS[report_data["report_id"]] = {
-                "report_id": report_data["report_id"],
-                "report_type": report_data["report_type"],
-                "all_data": report_data["all_data"],
-                "urgency": report_data["urgency"],
-                "photo_id": report_data.get("photo_id"),
-                "photo_url": report_data.get("photo_url"),
-                "photo_path": report_data.get("photo_path"),
-                "user_id": telegram_user.id,
-                "username": telegram_user.username,
-                "first_name": telegram_user.first_name,
-                "last_name": telegram_user.last_name,
-                "location": report_data.get("location", "Unknown"),
-                "created_at": now
-            }
-            logger.info(f"Report stored in memory: {report_data['report_id']}")
-            return REPORTS[report_data["report_id"]]
-            
-    except Exception as e:
-        logger.error(f"Error saving report to PostgreSQL database: {str(e)}")
-        # Save to in-memory storage as a last resort
-        REPORTS[report_data["report_id"]] = {
-            "report_id": report_data["report_id"],
-            "report_type": report_data["report_type"],
-            "all_data": report_data["all_data"],
-            "urgency": report_data["urgency"],
-            "photo_id": report_data.get("photo_id"),
-            "photo_url": report_data.get("photo_url"),
-            "photo_path": report_data.get("photo_path"),
-            "user_id": telegram_user.id,
-            "username": telegram_user.username,
-            "first_name": telegram_user.first_name,
-            "last_name": telegram_user.last_name,
-            "location": report_data.get("location", "Unknown"),
-            "created_at": datetime.now().isoformat()
-        }
-        logger.info(f"Report stored in memory: {report_data['report_id']}")
-        return REPORTS[report_data["report_id"]]
-
-async def get_report_by_id(report_id: str):
-    """Get a report by its ID."""
-    try:
-        # Try using existing Supabase client first
-        if is_db_ready():
-            response = supabase.table(pg_table).select('*').eq('report_id', report_id).execute()
-            
-            if response and hasattr(response, 'data') and len(response.data) > 0:
-                logger.info(f"Report found with ID: {report_id} via Supabase")
-                return response.data[0]
-        
-        # Fall back to direct PostgreSQL connection
-        conn = get_postgres_connection()
-        if conn is None:
-            logger.error("Could not establish PostgreSQL connection")
-            # Check in-memory storage as last resort
-            if REPORTS and report_id in REPORTS:
-                logger.info(f"Report found with ID: {report_id} in memory storage")
-                return REPORTS[report_id]
             return None
             
-        cursor = conn.cursor(cursor_factory=RealDictCursor)
-        
-        # SQL query to get the report
-        query = f"""
-        SELECT * FROM {pg_schema}.{pg_table}
-        WHERE report_id = %s;
-        """
-        
-        # Execute the query
-        cursor.execute(query, (report_id,))
-        
-        # Get the result
-        result = cursor.fetchone()
-        cursor.close()
-        
-        if result:
-            logger.info(f"Report found with ID: {report_id} via PostgreSQL")
-            return dict(result)
-        
-        # If no results from database, check in-memory storage
-        if REPORTS and report_id in REPORTS:
-            logger.info(f"Report found with ID: {report_id} in memory storage")
-            return REPORTS[report_id]
-            
-        logger.info(f"No report found with ID: {report_id}")
-        return None
-        
     except Exception as e:
-        logger.error(f"Error fetching report by ID: {str(e)}")
-        # Check in-memory storage as last resort after exception
-        if REPORTS and report_id in REPORTS:
-            logger.info(f"Report found with ID: {report_id} in memory storage after DB error")
-            return REPORTS[report_id]
+        logger.error("Error saving report to PostgreSQL database: %s", e)
         return None
 
 def search_reports_by_content(search_term: str) -> List[Dict[str, Any]]:
@@ -642,17 +573,17 @@ def search_reports_by_content(search_term: str) -> List[Dict[str, Any]]:
                 response = supabase.rpc("search_reports", {"search_term": search_term}).execute()
                 
                 if response.data:
-                    logger.info(f"Reports found matching term: {search_term} via Supabase RPC")
+                    logger.info("Reports found matching term: %s via Supabase RPC", search_term)
                     return response.data
             except Exception:
                 # If RPC fails, try direct query
                 response = supabase.table(pg_table).select("*").filter("all_data", "ilike", f"%{search_term}%").execute()
                 
                 if response.data:
-                    logger.info(f"Reports found matching term: {search_term} via Supabase filter")
+                    logger.info("Reports found matching term: %s via Supabase filter", search_term)
                     return response.data
     except Exception as e:
-        logger.warning(f"Error searching reports via Supabase: {str(e)}. Trying direct PostgreSQL connection...")
+        logger.warning("Error searching reports via Supabase: %s. Trying direct PostgreSQL connection...", e)
     
     # Fall back to direct PostgreSQL connection
     try:
@@ -678,14 +609,14 @@ def search_reports_by_content(search_term: str) -> List[Dict[str, Any]]:
         cursor.close()
         
         if results:
-            logger.info(f"Reports found matching term: {search_term} via PostgreSQL")
+            logger.info("Reports found matching term: %s via PostgreSQL", search_term)
             return [dict(row) for row in results]
         else:
-            logger.info(f"No reports found matching term: {search_term} in PostgreSQL")
+            logger.info("No reports found matching term: %s in PostgreSQL", search_term)
             return []
             
     except Exception as e:
-        logger.error(f"Error searching reports in PostgreSQL database: {str(e)}")
+        logger.error("Error searching reports in PostgreSQL database: %s", e)
         return []
 
 async def search_missing_people(search_term: str) -> List[Dict[str, Any]]:
@@ -700,76 +631,88 @@ async def search_missing_people(search_term: str) -> List[Dict[str, Any]]:
                 .filter("all_data", "ilike", f"%{search_term}%") \
                 .order("created_at", desc=True)
                 
-            response = query.execute()
+            # The Supabase client is synchronous; run the request off the event loop
+            response = await asyncio.to_thread(query.execute)
             
             if response.data:
-                logger.info(f"Missing person reports found matching term: {search_term} via Supabase")
+                logger.info("Missing person reports found matching term: %s via Supabase", search_term)
                 return response.data
     except Exception as e:
-        logger.warning(f"Error searching missing people via Supabase: {str(e)}. Trying direct PostgreSQL connection...")
+        logger.warning("Error searching missing people via Supabase: %s. Trying direct PostgreSQL connection...", e)
     
-    # Fall back to direct PostgreSQL connection
+    # Fall back to direct PostgreSQL connection; connecting retries with time.sleep,
+    # so it runs off the event loop along with the query
     try:
-        conn = get_postgres_connection()
+        conn = await asyncio.to_thread(get_postgres_connection)
         if conn is None:
             logger.error("Could not establish PostgreSQL connection")
             return []
         
-        cursor = conn.cursor(cursor_factory=RealDictCursor)
-        
-        # SQL query to search for missing person reports
-        query = f"""
-        SELECT * FROM {pg_schema}.{pg_table}
-        WHERE report_type = 'Missing Person (Earthquake)'
-        AND all_data ILIKE %s
-        ORDER BY created_at DESC;
-        """
-        
-        # Execute the query
-        cursor.execute(query, (f"%{search_term}%",))
-        
-        # Get the results
-        results = cursor.fetchall()
-        cursor.close()
-        
-        if results:
-            logger.info(f"Missing person reports found matching term: {search_term} via PostgreSQL")
-            return [dict(row) for row in results]
-        else:
-            logger.info(f"No missing person reports found matching term: {search_term} in PostgreSQL")
-            return []
+        return await asyncio.to_thread(_search_missing_people_pg, conn, search_term)
             
     except Exception as e:
-        logger.error(f"Error searching missing people in PostgreSQL database: {str(e)}")
+        logger.error("Error searching missing people in PostgreSQL database: %s", e)
         return []
 
+def _search_missing_people_pg(conn, search_term: str) -> List[Dict[str, Any]]:
+    """Blocking PostgreSQL half of search_missing_people"""
+    cursor = conn.cursor(cursor_factory=RealDictCursor)
+    
+    # SQL query to search for missing person reports
+    query = f"""
+    SELECT * FROM {pg_schema}.{pg_table}
+    WHERE report_type = 'Missing Person (Earthquake)'
+    AND all_data ILIKE %s
+    ORDER BY created_at DESC;
+    """
+    
+    # Execute the query
+    cursor.execute(query, (f"%{search_term}%",))
+    
+    # Get the results
+    results = cursor.fetchall()
+    cursor.close()
+    
+    if results:
+        logger.info("Missing person reports found matching term: %s via PostgreSQL", search_term)
+        return [dict(row) for row in results]
+    logger.info("No missing person reports found matching term: %s in PostgreSQL", search_term)
+    return []
+
 async def get_report(report_id: str) -> Optional[Dict[str, Any]]:
     """Get a report by ID with case-insensitive matching"""
+    cache_key = report_id.upper()
+    cached = _REPORT_LOOKUP_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+    
     try:
         # Try using Supabase with case-insensitive matching
         if is_db_ready():
             try:
                 # Use ILIKE for case-insensitive matching
-                response = supabase.table(pg_table).select('*').filter('report_id', 'ilike', report_id).execute()
+                query = supabase.table(pg_table).select('*').filter('report_id', 'ilike', report_id)
+                response = await asyncio.to_thread(query.execute)
                 
                 if response and hasattr(response, 'data') and len(response.data) > 0:
-                    logger.info(f"Report found with ID: {report_id} via Supabase case-insensitive match")
+                    logger.info("Report found with ID: %s via Supabase case-insensitive match", report_id)
+                    _REPORT_LOOKUP_CACHE[cache_key] = response.data[0]
                     return response.data[0]
             except Exception as supabase_error:
-                logger.error(f"Supabase error: {str(supabase_error)}")
+                logger.error("Supabase error: %s", supabase_error)
         
-        # Check in-memory storage
-        # Case-insensitive search in memory storage
-        for stored_id, report in REPORTS.items():
-            if stored_id.upper() == report_id.upper():
-                logger.info(f"Report found with ID: {stored_id} in memory (case-insensitive)")
-                return report
+        # Check in-memory storage; generated IDs are upper-case, so a direct lookup
+        # replaces scanning every entry
+        report = REPORTS.get(cache_key)
+        if report is not None:
+            logger.info("Report found with ID: %s in memory", cache_key)
+            return report
         
-        logger.info(f"No report found with ID: {report_id} in any storage")
+        logger.info("No report found with ID: %s in any storage", report_id)
         return None
         
     except Exception as e:
-        logger.error(f"Error getting report by ID: {str(e)}")
+        logger.error("Error getting report by ID: %s", e)
         return None
 
 # Clean up database connections when program exits
@@ -782,12 +725,21 @@ def close_connections():
             pg_conn.close()
             logger.info("PostgreSQL connection closed")
         except Exception as e:
-            logger.error(f"Error closing PostgreSQL connection: {str(e)}")
+            logger.error("Error closing PostgreSQL connection: %s", e)
         finally:
             pg_conn = None
 
+async def update_fallback_status(record: ReportRecord, status: str) -> None:
+    """Set the status of an in-memory fallback report and write it through to the local SQLite copy"""
+    # Imported here because fallback_store imports ReportRecord from this module
+    from utils.fallback_store import persist_report
+    record.status = status
+    await asyncio.to_thread(persist_report, record)
+
 async def update_report_status_in_db(report_id: str, status: str, user_id: int) -> bool:
     """Update the status of a report in the database."""
+    # Drop any cached lookup so the next search shows the new status
+    _REPORT_LOOKUP_CACHE.pop(report_id.upper(), None)
     try:
         # Make sure we have a valid status value
         if not status or status == 'No status set' or status == 'N/A':
@@ -796,80 +748,92 @@ async def update_report_status_in_db(report_id: str, status: str, user_id: int)
         if is_db_ready():
             try:
                 # First, verify the user owns this report
-                verification = supabase.table(pg_table).select("*").eq("report_id", report_id).eq("user_id", user_id).execute()
+                verification = await asyncio.to_thread(
+                    supabase.table(pg_table).select("report_id").eq("report_id", report_id).eq("user_id", user_id).execute
+                )
                 
                 if not verification.data:
-                    logger.warning(f"User {user_id} attempted to update report {report_id} but is not the owner")
+                    logger.warning("User %s attempted to update report %s but is not the owner", user_id, report_id)
                     return False
                 
                 # Update the status
-                response = supabase.table(pg_table).update({"status": status}).eq("report_id", report_id).execute()
+                response = await asyncio.to_thread(
+                    supabase.table(pg_table).update({"status": status}).eq("report_id", report_id).execute
+                )
                 
                 if response.data:
-                    logger.info(f"Successfully updated status of report {report_id} to {status}")
+                    logger.info("Successfully updated status of report %s to %s", report_id, status)
+                    # A get_report that ran while the update was in flight may have cached the old status
+                    _REPORT_LOOKUP_CACHE.pop(report_id.upper(), None)
                     
                     # Also update in-memory copy if exists
                     if report_id in REPORTS:
-                        REPORTS[report_id]['status'] = status
+                        await update_fallback_status(REPORTS[report_id], status)
                         
                     return True
                 else:
-                    logger.warning(f"No rows updated for report {report_id}")
+                    logger.warning("No rows updated for report %s", report_id)
                     return False
             except Exception as e:
-                logger.error(f"Supabase error updating report status: {str(e)}")
+                logger.error("Supabase error updating report status: %s", e)
                 # Fall through to direct PostgreSQL connection
         
-        # Try direct PostgreSQL connection
-        conn = get_postgres_connection(direct_connect=True)
+        # Try direct PostgreSQL connection, off the event loop like the query itself
+        conn = await asyncio.to_thread(get_postgres_connection, direct_connect=True)
         if conn is None:
             logger.error("Could not establish PostgreSQL connection")
             
             # Update in-memory storage as a last resort
             if report_id in REPORTS:
                 # Verify ownership
-                if REPORTS[report_id].get('user_id') == user_id:
-                    REPORTS[report_id]['status'] = status
-                    logger.info(f"Updated in-memory report {report_id} status to {status}")
+                if REPORTS[report_id].user_id == user_id:
+                    await update_fallback_status(REPORTS[report_id], status)
+                    logger.info("Updated in-memory report %s status to %s", report_id, status)
                     return True
                 else:
-                    logger.warning(f"User {user_id} attempted to update report {report_id} but is not the owner")
+                    logger.warning("User %s attempted to update report %s but is not the owner", user_id, report_id)
                     return False
             return False
         
-        cursor = conn.cursor()
-        
-        # Verify ownership first
-        cursor.execute(
-            f"SELECT report_id FROM {pg_schema}.{pg_table} WHERE report_id = %s AND user_id = %s",
-            (report_id, user_id)
-        )
-        
-        if not cursor.fetchone():
-            logger.warning(f"User {user_id} attempted to update report {report_id} but is not the owner")
-            cursor.close()
-            return False
-        
-        # Update status
-        cursor.execute(
-            f"UPDATE {pg_schema}.{pg_table} SET status = %s, updated_at = %s WHERE report_id = %s",
-            (status, datetime.now().isoformat(), report_id)
-        )
-        
-        conn.commit()
-        affected_rows = cursor.rowcount
-        cursor.close()
-        
-        if affected_rows > 0:
-            logger.info(f"Successfully updated status of report {report_id} to {status} via direct PG connection")
-            return True
-        else:
-            logger.warning(f"No rows updated for report {report_id} via direct PG connection")
-            return False
+        updated = await asyncio.to_thread(_update_report_status_pg, conn, report_id, status, user_id)
+        if updated:
+            _REPORT_LOOKUP_CACHE.pop(report_id.upper(), None)
+        return updated
             
     except Exception as e:
-        logger.error(f"Error updating report status: {str(e)}")
+        logger.error("Error updating report status: %s", e)
+        return False
+
+def _update_report_status_pg(conn, report_id: str, status: str, user_id: int) -> bool:
+    """Blocking PostgreSQL half of update_report_status_in_db"""
+    cursor = conn.cursor()
+    
+    # Verify ownership first
+    cursor.execute(
+        f"SELECT report_id FROM {pg_schema}.{pg_table} WHERE report_id = %s AND user_id = %s",
+        (report_id, user_id)
+    )
+    
+    if not cursor.fetchone():
+        logger.warning("User %s attempted to update report %s but is not the owner", user_id, report_id)
+        cursor.close()
         return False
+    
+    # Update status
+    cursor.execute(
+        f"UPDATE {pg_schema}.{pg_table} SET status = %s, updated_at = %s WHERE report_id = %s",
+        (status, datetime.now().isoformat(), report_id)
+    )
+    
+    conn.commit()
+    affected_rows = cursor.rowcount
+    cursor.close()
+    
+    if affected_rows > 0:
+        logger.info("Successfully updated status of report %s to %s via direct PG connection", report_id, status)
+        return True
+    logger.warning("No rows updated for report %s via direct PG connection", report_id)
+    return False
 
 async def update_existing_reports_status():
     """Update all existing reports that don't have a status to 'Still Missing'"""
@@ -887,7 +851,7 @@ async def update_existing_reports_status():
                 else:
                     # Update each report
                     count = len(response.data)
-                    logger.info(f"Found {count} reports without status in Supabase, updating...")
+                    logger.info("Found %s reports without status in Supabase, updating...", count)
                     
                     for report in response.data:
                         report_id = report.get('report_id')
@@ -897,14 +861,14 @@ async def update_existing_reports_status():
                         }).eq("report_id", report_id).execute()
                         
                         if update_response.data:
-                            logger.info(f"Updated report {report_id} status to 'Still Missing'")
+                            logger.info("Updated report %s status to 'Still Missing'", report_id)
                         else:
-                            logger.warning(f"Failed to update report {report_id}")
+                            logger.warning("Failed to update report %s", report_id)
                             
-                    logger.info(f"Completed updating {count} reports")
+                    logger.info("Completed updating %s reports", count)
                     return
             except Exception as e:
-                logger.error(f"Error updating reports via Supabase: {str(e)}")
+                logger.error("Error updating reports via Supabase: %s", e)
                 # Fall through to direct PostgreSQL
         
         # Try direct PostgreSQL connection
@@ -928,7 +892,7 @@ async def update_existing_reports_status():
         status_column_exists = cursor.fetchone()[0]
         
         if not status_column_exists:
-            logger.info(f"Adding 'status' column to {pg_table}")
+            logger.info("Adding 'status' column to %s", pg_table)
             cursor.execute(f"""
                 ALTER TABLE {pg_table}
                 ADD COLUMN status VARCHAR(100) DEFAULT 'Still Missing';
@@ -945,10 +909,10 @@ async def update_existing_reports_status():
             
             count = cursor.rowcount
             conn.commit()
-            logger.info(f"Updated {count} reports with NULL or invalid status to 'Still Missing'")
+            logger.info("Updated %s reports with NULL or invalid status to 'Still Missing'", count)
             
         cursor.close()
         logger.info("Update completed successfully")
         
     except Exception as e:
-        logger.error(f"Error updating existing reports: {str(e)}", exc_info=True)
+        logger.error("Error updating existing reports: %s", e, exc_info=True)
@@ -0,0 +1,66 @@
+import json
+import logging
+import sqlite3
+import threading
+from dataclasses import asdict
+from typing import Optional
+
+from config.constants import FALLBACK_DB_PATH
+from utils.db_utils import ReportRecord
+
+# Configure logger
+logger = logging.getLogger(__name__)
+
+_CREATE_TABLE = "CREATE TABLE IF NOT EXISTS reports (id TEXT PRIMARY KEY, data TEXT NOT NULL, ts INTEGER)"
+_UPSERT = "INSERT OR REPLACE INTO reports (id, data, ts) VALUES (?, ?, ?)"
+_SELECT = "SELECT data FROM reports WHERE id = ?"
+
+# One connection shared by the worker threads that call in here; the lock serializes its use
+_CONN = None
+_CONN_LOCK = threading.Lock()
+
+
+def _connection() -> sqlite3.Connection:
+    """Return the shared fallback database connection, creating it and the table on first use.
+
+    Callers must hold _CONN_LOCK.
+    """
+    global _CONN
+    if _CONN is None:
+        conn = sqlite3.connect(FALLBACK_DB_PATH, check_same_thread=False)
+        conn.execute(_CREATE_TABLE)
+        _CONN = conn
+    return _CONN
+
+
+def persist_report(record: ReportRecord) -> None:
+    """
+    Write an in-memory fallback report to the local SQLite file.
+
+    Blocking; call it from a worker thread (asyncio.to_thread) in handlers.
+    """
+    try:
+        with _CONN_LOCK:
+            conn = _connection()
+            with conn:
+                conn.execute(_UPSERT, (record.report_id, json.dumps(asdict(record), ensure_ascii=False), record.created_ns))
+    except sqlite3.Error as e:
+        logger.error("Failed to persist report %s locally: %s", record.report_id, e)
+
+
+def load_report(report_id: str) -> Optional[ReportRecord]:
+    """Read a fallback report back from the local SQLite file, or None if it isn't there"""
+    try:
+        with _CONN_LOCK:
+            row = _connection().execute(_SELECT, (report_id,)).fetchone()
+    except sqlite3.Error as e:
+        logger.error("Failed to load report %s from local store: %s", report_id, e)
+        return None
+    if not row:
+        return None
+    try:
+        return ReportRecord(**json.loads(row[0]))
+    except (TypeError, ValueError) as e:
+        # Rows written before a ReportRecord field change no longer fit the dataclass
+        logger.error("Stored report %s could not be read: %s", report_id, e)
+        return None
@@ -1,4 +1,3 @@
-import re
 import logging
 import pytz
 from telegram.ext import ApplicationBuilder
@@ -10,12 +9,14 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Translation table that prefixes each Markdown V2 special character with a backslash
+_MARKDOWN_V2_TABLE = str.maketrans({c: '\\' + c for c in r'_*[]()~`>#+-=|{}.!'})
+
 def escape_markdown_v2(text: str) -> str:
     """
     Helper function to escape special characters for Markdown V2 format
     """
-    escape_chars = r'_*[]()~`>#+-=|{}.!'
-    return re.sub(f'([{re.escape(escape_chars)}])', r'\\\1', text)
+    return text.translate(_MARKDOWN_V2_TABLE)
 
 def handle_report_error(update, error):
     """Handle and log errors during report processing."""